@@ -0,0 +1,66 @@
+"""
+Benchmark de HistorialConCache: aciertos y tiempo de una sesión simulada.
+
+Simula una sesión de navegación (páginas nuevas, retrocesos y avances en
+ráfagas) donde cada descarga tarda LATENCIA segundos, y compara distintos
+presupuestos de caché, con y sin precarga. Con presupuesto 0 solo se
+conservan las páginas fijadas (la actual y sus vecinas).
+
+Uso:  python benchmark_cache_paginas.py [pasos]
+"""
+
+import random
+import sys
+import time
+
+from cache_paginas import HistorialConCache
+
+LATENCIA = 0.002
+TAMANO_PAGINA = 50_000
+PRESUPUESTOS = [0, 5 * TAMANO_PAGINA, 20 * TAMANO_PAGINA, 100 * TAMANO_PAGINA]
+
+
+def descargar(nodo) -> bytes:
+    time.sleep(LATENCIA)
+    return bytes(TAMANO_PAGINA)
+
+
+def sesion(pasos: int, semilla: int = 3):
+    """Lista de movimientos: 'n' (página nueva), 'r' (retroceder), 'a' (avanzar)."""
+    rnd = random.Random(semilla)
+    movimientos = []
+    while len(movimientos) < pasos:
+        movimiento = rnd.choice("nnra")
+        movimientos.extend(movimiento * rnd.randint(1, 4))
+    return movimientos[:pasos]
+
+
+def recorrer(historial: HistorialConCache, movimientos) -> float:
+    inicio = time.perf_counter()
+    for i, movimiento in enumerate(movimientos):
+        if movimiento == "n":
+            historial.agregar_pagina(f"sitio{i}.com", f"Página {i}", "10:00 AM")
+        elif movimiento == "r":
+            historial.retroceder()
+        else:
+            historial.avanzar()
+        historial.contenido()
+        time.sleep(LATENCIA)  # el usuario "lee" la página: da tiempo a la precarga
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    pasos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    movimientos = sesion(pasos)
+
+    print(f"{'presupuesto (KB)':>16} | {'precarga':>8} | {'aciertos':>8} | {'fallos':>6} | "
+          f"{'desalojos':>9} | {'tiempo (s)':>10}")
+    print("-" * 75)
+    for presupuesto in PRESUPUESTOS:
+        for precargar in (False, True):
+            historial = HistorialConCache(descargar, presupuesto, precargar=precargar)
+            segundos = recorrer(historial, movimientos)
+            historial.cerrar()
+            e = historial.cache.estadisticas()
+            print(f"{presupuesto // 1024:>16} | {'sí' if precargar else 'no':>8} | {e['aciertos']:>8} | "
+                  f"{e['fallos']:>6} | {e['desalojos']:>9} | {segundos:>10.2f}")
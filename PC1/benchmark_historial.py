@@ -0,0 +1,52 @@
+"""
+Benchmark de latencia por operación de HistorialNavegacion.
+
+Para historiales de 10^3 a 10^6 páginas (con URLs y títulos repetidos)
+mide el tiempo medio de buscar por URL, buscar por título y
+eliminar_pagina + agregar_pagina. Con los índices URL/título la latencia
+debe mantenerse plana al crecer el historial.
+
+Uso:  python benchmark_historial.py [tamaño ...]
+"""
+
+import random
+import sys
+import time
+
+from pc1_2 import HistorialNavegacion
+
+CONSULTAS = 10_000
+
+
+def construir(n: int) -> HistorialNavegacion:
+    historial = HistorialNavegacion()
+    for i in range(n):
+        # ~4 visitas por URL y ~8 por título
+        historial.agregar_pagina(f"sitio{i // 4}.com/p{i % 4}", f"Título {i // 8}", "10:00 AM")
+    return historial
+
+
+def microsegundos(funcion, argumentos) -> float:
+    inicio = time.perf_counter()
+    for argumento in argumentos:
+        funcion(*argumento)
+    return (time.perf_counter() - inicio) / len(argumentos) * 1e6
+
+
+if __name__ == "__main__":
+    tamanos = [int(a) for a in sys.argv[1:]] or [10**3, 10**4, 10**5, 10**6]
+    rnd = random.Random(7)
+    print(f"{'páginas':>9} | {'buscar url (us)':>15} | {'buscar título (us)':>18} | {'eliminar+agregar (us)':>21}")
+    print("-" * 74)
+    for n in tamanos:
+        historial = construir(n)
+        urls = [(f"sitio{rnd.randrange(n // 4)}.com/p{rnd.randrange(4)}",) for _ in range(CONSULTAS)]
+        titulos = [(f"Título {rnd.randrange(n // 8)}",) for _ in range(CONSULTAS)]
+
+        def eliminar_y_agregar(url):
+            historial.eliminar_pagina(url)
+            historial.agregar_pagina(url, "Reinsertada", "11:00 AM")
+
+        print(f"{n:>9} | {microsegundos(historial.buscar, urls):>15.2f} | "
+              f"{microsegundos(historial.buscar, titulos):>18.2f} | "
+              f"{microsegundos(eliminar_y_agregar, urls):>21.2f}")
@@ -0,0 +1,59 @@
+"""
+Benchmark de memoria y pausas del GC: HistorialNavegacion vs HistorialArreglos.
+
+Para cada tamaño construye el historial con las dos implementaciones y mide
+la memoria asignada (tracemalloc), el tiempo de construcción y la pausa de
+una recolección completa (gc.collect), que con nodos objeto crece con el
+número de páginas y con arreglos queda casi constante.
+
+Uso:  python benchmark_historial_arreglos.py [tamaño ...]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from historial_arreglos import HistorialArreglos
+from pc1_2 import HistorialNavegacion
+
+IMPLEMENTACIONES = [("objetos", HistorialNavegacion), ("arreglos", HistorialArreglos)]
+RECOLECCIONES = 5
+
+
+def construir(clase, n: int):
+    historial = clase()
+    for i in range(n):
+        # ~4 visitas por URL y ~8 por título, horas repetidas
+        historial.agregar_pagina(f"sitio{i // 4}.com/p{i % 4}", f"Título {i // 8}", f"{i // 60 % 24:02d}:{i % 60:02d}")
+    return historial
+
+
+def medir(clase, n: int):
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    historial = construir(clase, n)
+    construccion = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    pausas = []
+    for _ in range(RECOLECCIONES):
+        inicio = time.perf_counter()
+        gc.collect()
+        pausas.append(time.perf_counter() - inicio)
+    del historial
+    return memoria, construccion, min(pausas)
+
+
+if __name__ == "__main__":
+    tamanos = [int(a) for a in sys.argv[1:]] or [10**4, 10**5, 10**6]
+    print(f"{'páginas':>9} | {'versión':>8} | {'memoria (MB)':>12} | {'bytes/página':>12} | "
+          f"{'construir (s)':>13} | {'gc.collect (ms)':>15}")
+    print("-" * 86)
+    for n in tamanos:
+        for nombre, clase in IMPLEMENTACIONES:
+            memoria, construccion, pausa = medir(clase, n)
+            print(f"{n:>9} | {nombre:>8} | {memoria / 2**20:>12.1f} | {memoria / n:>12.0f} | "
+                  f"{construccion:>13.2f} | {pausa * 1e3:>15.2f}")
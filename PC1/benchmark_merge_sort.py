@@ -0,0 +1,59 @@
+"""
+Benchmark de ordenamiento de catálogos de cursos por hora de inicio.
+
+Compara:
+- merge_sort (recursivo, con rebanadas y una lista nueva por merge),
+- merge_sort_iterativo (bottom-up, dos buffers y claves precalculadas),
+- sorted() de Python con la misma clave.
+
+Uso:
+    python benchmark_merge_sort.py                 # 10^5 y 10^6 cursos
+    python benchmark_merge_sort.py 100000 10000000 # tamaños a elección
+"""
+
+import random
+import sys
+import time
+
+from pc1_1 import clave_hora_inicio, merge_sort, merge_sort_iterativo
+
+
+def generar_catalogo(n: int, semilla: int = 42):
+    """Genera n cursos con horas "HH:MM" aleatorias entre 07:00 y 22:45."""
+    rnd = random.Random(semilla)
+    return [
+        {
+            "codigo": f"C{i:08d}",
+            "nombre": f"Curso {i}",
+            "hora_inicio": f"{rnd.randint(7, 22):02d}:{rnd.choice((0, 15, 30, 45)):02d}",
+        }
+        for i in range(n)
+    ]
+
+
+def medir(funcion, cursos):
+    inicio = time.perf_counter()
+    resultado = funcion(cursos)
+    return time.perf_counter() - inicio, resultado
+
+
+if __name__ == "__main__":
+    tamanos = [int(a) for a in sys.argv[1:]] or [10**5, 10**6]
+    variantes = [
+        ("merge_sort recursivo", merge_sort),
+        ("merge_sort_iterativo", merge_sort_iterativo),
+        ("sorted()", lambda cursos: sorted(cursos, key=clave_hora_inicio)),
+    ]
+
+    print(f"{'n':>10} | {'algoritmo':<22} | {'segundos':>9}")
+    print("-" * 48)
+    for n in tamanos:
+        cursos = generar_catalogo(n)
+        referencia = None
+        for nombre, funcion in variantes:
+            segundos, resultado = medir(funcion, cursos)
+            # Todas las variantes son estables: deben dar el mismo orden
+            if referencia is None:
+                referencia = resultado
+            assert resultado == referencia, nombre
+            print(f"{n:>10} | {nombre:<22} | {segundos:>9.3f}")
@@ -0,0 +1,40 @@
+"""
+Benchmark de escalamiento de merge_sort_paralelo de 1 a N núcleos.
+
+Para cada cantidad de procesos se ordena el mismo catálogo y se reporta el
+tiempo y la aceleración respecto de merge_sort_iterativo (serial). También
+se verifica que la salida sea idéntica a la de la versión serial estable.
+
+Uso:
+    python benchmark_paralelo.py                # 10^6 cursos, 1..núcleos
+    python benchmark_paralelo.py 5000000 8      # n y máximo de procesos
+"""
+
+import os
+import sys
+import time
+
+from benchmark_merge_sort import generar_catalogo
+from pc1_1 import merge_sort_iterativo, merge_sort_paralelo
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    cursos = generar_catalogo(n)
+
+    inicio = time.perf_counter()
+    referencia = merge_sort_iterativo(cursos)
+    serial = time.perf_counter() - inicio
+
+    print(f"n = {n}, serial: {serial:.3f} s")
+    print(f"{'procesos':>8} | {'segundos':>9} | {'aceleración':>11}")
+    print("-" * 35)
+    # Potencias de 2 hasta el máximo, y el máximo mismo
+    conteos = sorted({2**i for i in range(max_workers.bit_length())} | {max_workers})
+    for workers in conteos:
+        inicio = time.perf_counter()
+        resultado = merge_sort_paralelo(cursos, workers=workers)
+        segundos = time.perf_counter() - inicio
+        assert resultado == referencia
+        print(f"{workers:>8} | {segundos:>9.3f} | {serial / segundos:>10.2f}x")
@@ -0,0 +1,250 @@
+"""
+Caché del contenido de las páginas del historial para retroceder/avanzar.
+
+Problema:
+- retroceder y avanzar solo mueven un puntero: el proxy vuelve a descargar
+  y a renderizar cada página a la que el usuario regresa.
+
+Decisiones:
+- CachePaginas guarda el contenido por nodo del historial (la identidad del
+  NodoPagina, no la URL: dos visitas a la misma URL son entradas distintas)
+  en un OrderedDict usado como LRU con presupuesto en bytes.
+- Las páginas vecinas de la actual (prev, actual, next) quedan fijadas: el
+  desalojo las salta, así las idas y vueltas siempre aciertan. Si solo las
+  fijadas ya superan el presupuesto, se tolera el exceso.
+- Con precargar=True, al moverse se cargan en un hilo de fondo (un solo
+  worker) las vecinas que falten, un paso en cada dirección. Si se pide una
+  página que se está precargando, se espera esa carga en lugar de repetirla.
+- Contadores de aciertos, fallos, desalojos y precargas para dimensionarla.
+- HistorialConCache conecta la caché con HistorialNavegacion: repinta las
+  fijadas en cada movimiento y olvida el contenido de las páginas borradas.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+
+from pc1_2 import HistorialNavegacion, NodoPagina
+
+
+class CachePaginas:
+    """
+    LRU de contenido por nodo con presupuesto en bytes.
+    cargar: función que obtiene el contenido de un nodo (descarga/render).
+    tamano: bytes de un contenido (por defecto len).
+    """
+
+    def __init__(self, cargar: Callable[[NodoPagina], bytes], max_bytes: int,
+                 precargar: bool = False, tamano: Callable[[bytes], int] = len):
+        self.cargar = cargar
+        self.max_bytes = max_bytes
+        self.tamano = tamano
+        self.contenidos: "OrderedDict[NodoPagina, bytes]" = OrderedDict()  # más reciente al final
+        self.bytes_usados = 0
+        self.fijadas: Set[NodoPagina] = set()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.precargas = 0
+        self._lock = threading.Lock()
+        self._en_vuelo: Dict[NodoPagina, Future] = {}
+        self._worker = ThreadPoolExecutor(max_workers=1) if precargar else None
+
+    # --------------------------
+    # Lectura
+    # --------------------------
+    def obtener(self, nodo: NodoPagina) -> bytes:
+        """Contenido del nodo: desde la caché, desde una precarga en curso o cargándolo."""
+        with self._lock:
+            contenido = self.contenidos.get(nodo)
+            if contenido is not None:
+                self.contenidos.move_to_end(nodo)
+                self.aciertos += 1
+                return contenido
+            futuro = self._en_vuelo.get(nodo)
+            if futuro is not None:
+                self.aciertos += 1
+            else:
+                self.fallos += 1
+        if futuro is not None:
+            return futuro.result()
+        contenido = self.cargar(nodo)
+        with self._lock:
+            self._guardar(nodo, contenido)
+        return contenido
+
+    def __contains__(self, nodo: NodoPagina) -> bool:
+        return nodo in self.contenidos
+
+    # --------------------------
+    # Fijadas y precarga
+    # --------------------------
+    def fijar(self, actual: Optional[NodoPagina] = None, *vecinas: Optional[NodoPagina]) -> None:
+        """
+        Reemplaza las páginas fijadas por la actual y sus vecinas; si hay
+        precarga, carga en fondo las vecinas que falten (la actual la pide
+        quien navega).
+        """
+        vecinas = {nodo for nodo in vecinas if nodo is not None and nodo is not actual}
+        with self._lock:
+            self.fijadas = (vecinas | {actual}) if actual is not None else vecinas
+            self._desalojar()
+            if self._worker is None:
+                return
+            for nodo in vecinas:
+                if nodo not in self.contenidos and nodo not in self._en_vuelo:
+                    self._en_vuelo[nodo] = self._worker.submit(self._precargar, nodo)
+
+    def _precargar(self, nodo: NodoPagina) -> bytes:
+        try:
+            contenido = self.cargar(nodo)
+        except BaseException:
+            # Quien espere este futuro recibe el error; el próximo intento vuelve a cargar
+            with self._lock:
+                self._en_vuelo.pop(nodo, None)
+            raise
+        with self._lock:
+            # Si la página se olvidó mientras se cargaba, no se guarda
+            if nodo in self._en_vuelo:
+                del self._en_vuelo[nodo]
+                self.precargas += 1
+                self._guardar(nodo, contenido)
+        return contenido
+
+    # --------------------------
+    # Escritura y desalojo (con el lock tomado)
+    # --------------------------
+    def _guardar(self, nodo: NodoPagina, contenido: bytes) -> None:
+        tamano = self.tamano(contenido)
+        if nodo not in self.fijadas and tamano > self.max_bytes:
+            return  # no entra ni vaciando la caché
+        anterior = self.contenidos.pop(nodo, None)
+        if anterior is not None:
+            self.bytes_usados -= self.tamano(anterior)
+        self.contenidos[nodo] = contenido
+        self.bytes_usados += tamano
+        self._desalojar()
+
+    def _desalojar(self) -> None:
+        """Saca las menos recientes (sin tocar las fijadas) hasta volver al presupuesto."""
+        saltadas = []  # fijadas que estaban en el extremo LRU (a lo sumo 3)
+        while self.bytes_usados > self.max_bytes and self.contenidos:
+            nodo, contenido = self.contenidos.popitem(last=False)
+            if nodo in self.fijadas:
+                saltadas.append((nodo, contenido))
+                continue
+            self.bytes_usados -= self.tamano(contenido)
+            self.desalojos += 1
+        for nodo, contenido in reversed(saltadas):  # vuelven a su lugar, en el mismo orden
+            self.contenidos[nodo] = contenido
+            self.contenidos.move_to_end(nodo, last=False)
+
+    def olvidar(self, nodo: NodoPagina) -> None:
+        """Descarta el contenido de un nodo que ya no está en el historial."""
+        with self._lock:
+            contenido = self.contenidos.pop(nodo, None)
+            if contenido is not None:
+                self.bytes_usados -= self.tamano(contenido)
+            self._en_vuelo.pop(nodo, None)
+            self.fijadas.discard(nodo)
+
+    # --------------------------
+    # Estado
+    # --------------------------
+    def estadisticas(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "paginas": len(self.contenidos),
+                "bytes": self.bytes_usados,
+                "max_bytes": self.max_bytes,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "precargas": self.precargas,
+            }
+
+    def cerrar(self) -> None:
+        if self._worker is not None:
+            self._worker.shutdown(wait=True)
+
+
+class HistorialConCache(HistorialNavegacion):
+    """
+    HistorialNavegacion con una CachePaginas: contenido() devuelve el de la
+    página actual y cada movimiento fija prev/actual/next.
+    El resto de opciones (max_paginas, busqueda, ...) pasan a HistorialNavegacion.
+    """
+
+    def __init__(self, cargar: Callable[[NodoPagina], bytes], max_bytes_cache: int,
+                 precargar: bool = False, **opciones):
+        super().__init__(**opciones)
+        self.cache = CachePaginas(cargar, max_bytes_cache, precargar)
+
+    def _fijar_vecinas(self) -> None:
+        actual = self.current
+        if actual is None:
+            self.cache.fijar()
+        else:
+            self.cache.fijar(actual, actual.prev, actual.next)
+
+    def contenido(self) -> Optional[bytes]:
+        """Contenido de la página actual (None si el historial está vacío)."""
+        return self.cache.obtener(self.current) if self.current else None
+
+    def _desenlazar(self, nodo: NodoPagina) -> None:
+        super()._desenlazar(nodo)
+        self.cache.olvidar(nodo)
+
+    def agregar_pagina(self, url: str, titulo: str, hora: str) -> None:
+        super().agregar_pagina(url, titulo, hora)
+        self._fijar_vecinas()
+
+    def retroceder(self) -> Optional[NodoPagina]:
+        nodo = super().retroceder()
+        if nodo is not None:
+            self._fijar_vecinas()
+        return nodo
+
+    def avanzar(self) -> Optional[NodoPagina]:
+        nodo = super().avanzar()
+        if nodo is not None:
+            self._fijar_vecinas()
+        return nodo
+
+    def eliminar_pagina(self, url: str) -> bool:
+        eliminada = super().eliminar_pagina(url)
+        if eliminada:
+            self._fijar_vecinas()
+        return eliminada
+
+    def ir_a_hora(self, hora) -> Optional[NodoPagina]:
+        nodo = super().ir_a_hora(hora)
+        if nodo is not None:
+            self._fijar_vecinas()
+        return nodo
+
+    def cerrar(self) -> None:
+        self.cache.cerrar()
+
+
+# --------------------------
+# Ejemplo de uso
+# --------------------------
+if __name__ == "__main__":
+    def descargar(nodo: NodoPagina) -> bytes:
+        print(f"  (descargando {nodo.url})")
+        return f"<html><title>{nodo.titulo}</title></html>".encode() * 10
+
+    historial = HistorialConCache(descargar, max_bytes_cache=1000)
+    for url, titulo, hora in [("google.com", "Google", "10:00 AM"), ("wikipedia.org", "Wikipedia", "10:05 AM"),
+                              ("github.com", "GitHub", "10:10 AM"), ("stackoverflow.com", "Stack Overflow", "10:15 AM")]:
+        historial.agregar_pagina(url, titulo, hora)
+        historial.contenido()
+
+    print("Retroceder dos veces y avanzar una:")
+    for mover in (historial.retroceder, historial.retroceder, historial.avanzar):
+        print(mover())
+        historial.contenido()
+    print("Estadísticas:", historial.cache.estadisticas())
+    historial.cerrar()
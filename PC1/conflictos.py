@@ -0,0 +1,157 @@
+"""
+Detección de cruces de horario entre cursos con barrido y árbol de intervalos.
+
+Problema:
+- Detectar secciones que se solapan (misma aula, mismo alumno, etc.) sin
+  comparar todos los pares (O(n²)).
+- Responder "¿qué cursos chocan con este horario?" muchas veces.
+
+Decisiones:
+- Cada curso lleva además 'hora_fin' ("HH:MM"); su horario es el intervalo
+  semiabierto [hora_inicio, hora_fin): un curso que termina a las 10:00 no
+  choca con otro que empieza a las 10:00.
+- detectar_conflictos ordena con merge_sort_iterativo por hora de inicio y
+  hace un barrido con un heap de cursos activos (ordenados por hora de fin):
+  O(n log n + k), con k la cantidad de pares reportados.
+- ArbolIntervalos es un árbol de intervalos centrado, construido una vez a
+  partir del mismo orden; cada consulta cuesta O(log n + k).
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+from pc1_1 import clave_hora_inicio, hora_a_minutos, merge_sort_iterativo
+
+Intervalo = Tuple[int, int, Dict]  # (inicio en minutos, fin en minutos, curso)
+
+
+def clave_hora_fin(curso: Dict) -> int:
+    """'hora_fin' del curso en minutos."""
+    return hora_a_minutos(curso["hora_fin"])
+
+def _intervalos(cursos: List[Dict]) -> List[Intervalo]:
+    """Intervalos ordenados por hora de inicio (estable)."""
+    return [(clave_hora_inicio(c), clave_hora_fin(c), c) for c in merge_sort_iterativo(cursos)]
+
+
+# --------------------------
+# Barrido: todos los pares que se cruzan
+# --------------------------
+def detectar_conflictos(cursos: List[Dict], por: Optional[str] = None) -> List[Tuple[Dict, Dict]]:
+    """
+    Devuelve los pares (a, b) de cursos cuyos horarios se solapan; a empieza antes
+    (o a la misma hora y apareció antes en la lista).
+    por: si se indica un campo (por ejemplo "aula"), solo se comparan cursos con el
+    mismo valor en ese campo.
+    """
+    conflictos: List[Tuple[Dict, Dict]] = []
+    activos: Dict[Any, List[Tuple[int, int, Dict]]] = {}  # un heap por grupo
+    for orden, (inicio, fin, curso) in enumerate(_intervalos(cursos)):
+        heap = activos.setdefault(curso.get(por) if por else None, [])
+        # Salen los cursos que terminaron antes de que empiece este
+        while heap and heap[0][0] <= inicio:
+            heapq.heappop(heap)
+        if inicio >= fin:
+            continue  # horario vacío: no choca con nada
+        for _, _, otro in heap:
+            conflictos.append((otro, curso))
+        heapq.heappush(heap, (fin, orden, curso))
+    return conflictos
+
+
+# --------------------------
+# Árbol de intervalos centrado
+# --------------------------
+class NodoIntervalo:
+    def __init__(self, centro: int, por_inicio: List[Intervalo]):
+        self.centro = centro
+        # Intervalos que contienen al centro, ordenados por inicio y por fin (desc.)
+        self.por_inicio = por_inicio
+        self.por_fin = sorted(por_inicio, key=lambda iv: iv[1], reverse=True)
+        self.izquierdo: Optional["NodoIntervalo"] = None
+        self.derecho: Optional["NodoIntervalo"] = None
+
+class ArbolIntervalos:
+    """Árbol de intervalos estático sobre los horarios de una lista de cursos."""
+
+    def __init__(self, cursos: List[Dict]):
+        self.raiz = self._construir([iv for iv in _intervalos(cursos) if iv[0] < iv[1]])
+
+    def _construir(self, intervalos: List[Intervalo]) -> Optional[NodoIntervalo]:
+        # 'intervalos' llega ordenado por inicio y el reparto conserva ese orden
+        if not intervalos:
+            return None
+        extremos = sorted(e for iv in intervalos for e in iv[:2])
+        centro = extremos[len(extremos) // 2]
+        izquierda, medio, derecha = [], [], []
+        for iv in intervalos:
+            if iv[1] <= centro:
+                izquierda.append(iv)
+            elif iv[0] > centro:
+                derecha.append(iv)
+            else:
+                medio.append(iv)
+        if not medio:
+            # El centro no toca ningún intervalo: se usa el inicio del central
+            centro = intervalos[len(intervalos) // 2][0]
+            izquierda = [iv for iv in intervalos if iv[1] <= centro]
+            medio = [iv for iv in intervalos if iv[0] <= centro < iv[1]]
+            derecha = [iv for iv in intervalos if iv[0] > centro]
+        nodo = NodoIntervalo(centro, medio)
+        nodo.izquierdo = self._construir(izquierda)
+        nodo.derecho = self._construir(derecha)
+        return nodo
+
+    def solapados(self, desde: str, hasta: str) -> List[Dict]:
+        """Cursos cuyo horario se cruza con [desde, hasta)."""
+        a, b = hora_a_minutos(desde), hora_a_minutos(hasta)
+        resultado: List[Dict] = []
+        nodo = self.raiz
+        pendientes = [nodo] if nodo and a < b else []
+        while pendientes:
+            nodo = pendientes.pop()
+            if b <= nodo.centro:
+                # Consulta a la izquierda del centro: sirven los que empiezan antes de b
+                for inicio, _, curso in nodo.por_inicio:
+                    if inicio >= b:
+                        break
+                    resultado.append(curso)
+                hijos = [nodo.izquierdo]
+            elif a > nodo.centro:
+                # Consulta a la derecha del centro: sirven los que terminan después de a
+                for _, fin, curso in nodo.por_fin:
+                    if fin <= a:
+                        break
+                    resultado.append(curso)
+                hijos = [nodo.derecho]
+            else:
+                # La consulta contiene al centro: todos los del nodo se cruzan
+                resultado.extend(curso for _, _, curso in nodo.por_inicio)
+                hijos = [nodo.izquierdo, nodo.derecho]
+            pendientes.extend(h for h in hijos if h)
+        return resultado
+
+
+# --------------------------
+# Programa principal
+# --------------------------
+if __name__ == "__main__":
+    cursos = [
+        {"codigo": "MiT101", "nombre": "Microeconomia", "hora_inicio": "10:15", "hora_fin": "11:45", "aula": "A1"},
+        {"codigo": "FIS202", "nombre": "Física II", "hora_inicio": "18:00", "hora_fin": "19:30", "aula": "B2"},
+        {"codigo": "AlGG305", "nombre": "Algoritmo2 ", "hora_inicio": "09:45", "hora_fin": "11:15", "aula": "A1"},
+        {"codigo": "TIST110", "nombre": "Tecnologia Informacion", "hora_inicio": "08:45", "hora_fin": "10:15", "aula": "B2"},
+    ]
+
+    print("=== Cruces de horario (todos) ===")
+    for a, b in detectar_conflictos(cursos):
+        print(f"{a['codigo']} ({a['hora_inicio']}-{a['hora_fin']}) choca con {b['codigo']} ({b['hora_inicio']}-{b['hora_fin']})")
+
+    print("\n=== Cruces de horario en la misma aula ===")
+    for a, b in detectar_conflictos(cursos, por="aula"):
+        print(f"Aula {a['aula']}: {a['codigo']} choca con {b['codigo']}")
+
+    arbol = ArbolIntervalos(cursos)
+    print("\nCursos que se cruzan con 10:00-10:30:")
+    for c in arbol.solapados("10:00", "10:30"):
+        print(c)
@@ -0,0 +1,139 @@
+"""
+Representación columnar (NumPy) de los cursos para ordenar y buscar por lotes.
+
+Problema:
+- Con una lista de diccionarios cada comparación de merge_sort y cada
+  binary_search pasan por el intérprete; con millones de consultas por
+  lote el costo por consulta de Python domina.
+
+Decisiones:
+- Los cursos se guardan en tres arreglos paralelos: códigos, nombres y hora
+  de inicio en minutos (int32), que se calcula una sola vez.
+- El ordenamiento usa np.argsort(kind="stable"): mismo orden que merge_sort.
+- Las búsquedas por lote usan np.searchsorted sobre los minutos ordenados:
+  una sola llamada resuelve un arreglo completo de horas.
+- Requiere NumPy; pc1_1.py sigue funcionando sin él.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pc1_1 import hora_a_minutos
+
+
+def horas_a_minutos(horas: Sequence[str]) -> np.ndarray:
+    """Convierte un arreglo de horas "HH:MM" a minutos (int32) de forma vectorizada."""
+    arreglo = np.asarray(horas)
+    if arreglo.size and arreglo.dtype.kind == "U" and arreglo.dtype.itemsize == 5 * 4:
+        if np.all(np.char.str_len(arreglo) == 5):
+            # Cada hora como 5 códigos de carácter: H H : M M (la vista exige memoria
+            # contigua y en orden nativo: un corte como horas[::2] se copia antes)
+            contiguo = np.ascontiguousarray(arreglo, dtype="U5")
+            d = contiguo.view(np.uint32).reshape(-1, 5).astype(np.int32) - ord("0")
+            digitos = d[:, [0, 1, 3, 4]]
+            if np.all(d[:, 2] == ord(":") - ord("0")) and np.all((digitos >= 0) & (digitos <= 9)):
+                minutos = (d[:, 0] * 10 + d[:, 1]) * 60 + d[:, 3] * 10 + d[:, 4]
+                return minutos.astype(np.int32).reshape(arreglo.shape)
+    # Formatos irregulares ("9:05", "10h15", etc.): se convierte una por una
+    # (y una hora inválida lanza ValueError igual que hora_a_minutos)
+    return np.fromiter((hora_a_minutos(h) for h in arreglo.ravel()), dtype=np.int32,
+                       count=arreglo.size).reshape(arreglo.shape)
+
+
+class CursosColumnar:
+    """Cursos como columnas NumPy: codigos, nombres y minutos de inicio."""
+
+    def __init__(self, codigos: np.ndarray, nombres: np.ndarray, minutos: np.ndarray, ordenado: bool = False):
+        self.codigos = codigos
+        self.nombres = nombres
+        self.minutos = minutos
+        self.ordenado = ordenado
+
+    @classmethod
+    def desde_dicts(cls, cursos: List[Dict]) -> "CursosColumnar":
+        """Construye las columnas a partir de la lista de diccionarios de pc1_1.py."""
+        return cls(
+            np.array([c["codigo"] for c in cursos], dtype=object),
+            np.array([c["nombre"] for c in cursos], dtype=object),
+            horas_a_minutos([c["hora_inicio"] for c in cursos]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.minutos)
+
+    def curso(self, i: int) -> Dict:
+        """Fila i como diccionario, con el mismo formato que pc1_1.py."""
+        m = int(self.minutos[i])
+        return {"codigo": self.codigos[i], "nombre": self.nombres[i], "hora_inicio": f"{m // 60:02d}:{m % 60:02d}"}
+
+    def a_dicts(self) -> List[Dict]:
+        return [self.curso(i) for i in range(len(self))]
+
+    # --------------------------
+    # Ordenamiento
+    # --------------------------
+    def orden(self) -> np.ndarray:
+        """Permutación estable que ordena por hora de inicio (reemplaza a merge_sort)."""
+        return np.argsort(self.minutos, kind="stable")
+
+    def ordenar(self) -> "CursosColumnar":
+        """Devuelve una copia ordenada por hora de inicio."""
+        p = self.orden()
+        return CursosColumnar(self.codigos[p], self.nombres[p], self.minutos[p], ordenado=True)
+
+    # --------------------------
+    # Búsqueda binaria por lotes
+    # --------------------------
+    def _verificar_orden(self) -> None:
+        if not self.ordenado:
+            raise ValueError("Las búsquedas requieren cursos ordenados: use ordenar() primero")
+
+    def buscar_lote(self, horas: Sequence[str]) -> np.ndarray:
+        """
+        Versión por lotes de binary_search: para cada hora devuelve el índice del
+        primer curso que empieza a esa hora, o -1 si no hay ninguno.
+        """
+        self._verificar_orden()
+        consultas = horas_a_minutos(horas)
+        indices = np.searchsorted(self.minutos, consultas, side="left")
+        dentro = indices < len(self.minutos)
+        encontrado = np.zeros(consultas.shape, dtype=bool)
+        encontrado[dentro] = self.minutos[indices[dentro]] == consultas[dentro]
+        return np.where(encontrado, indices, -1)
+
+    def rangos_lote(self, horas: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Para cada hora devuelve (inicio, fin) tales que los cursos de esa hora son
+        las filas inicio..fin-1 (vacío si inicio == fin).
+        """
+        self._verificar_orden()
+        consultas = horas_a_minutos(horas)
+        return (np.searchsorted(self.minutos, consultas, side="left"),
+                np.searchsorted(self.minutos, consultas, side="right"))
+
+    def buscar(self, hora: str) -> Optional[Dict]:
+        """Igual que binary_search de pc1_1.py: un curso a esa hora o None."""
+        i = int(self.buscar_lote([hora])[0])
+        return self.curso(i) if i >= 0 else None
+
+
+# --------------------------
+# Programa principal
+# --------------------------
+if __name__ == "__main__":
+    cursos = [
+        {"codigo": "MiT101", "nombre": "Microeconomia", "hora_inicio": "10:15"},
+        {"codigo": "FIS202", "nombre": "Física II", "hora_inicio": "18:00"},
+        {"codigo": "AlGG305", "nombre": "Algoritmo2 ", "hora_inicio": "09:45"},
+        {"codigo": "TIST110", "nombre": "Tecnologia Informacion", "hora_inicio": "08:45"},
+    ]
+
+    columnas = CursosColumnar.desde_dicts(cursos).ordenar()
+    print("=== Cursos ordenados (columnar) ===")
+    for c in columnas.a_dicts():
+        print(c)
+
+    horas = ["09:45", "12:00", "18:00"]
+    print("\nÍndices para", horas, "->", columnas.buscar_lote(horas))
+    print("Curso a las 10:15:", columnas.buscar("10:15"))
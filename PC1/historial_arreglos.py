@@ -0,0 +1,263 @@
+"""
+Historial de navegación sobre arreglos: lista doblemente enlazada por índices.
+
+Problema:
+- Con decenas de millones de páginas, un objeto NodoPagina por página (con
+  sus referencias prev/next) agota la memoria y el recolector de basura
+  detiene el proceso recorriendo todos esos objetos.
+
+Decisiones:
+- Cada página es una posición ("slot") en arreglos tipados paralelos
+  (array('q')): prev, next, ids de url/título/hora y orden de llegada.
+  -1 hace de None.
+- Los textos se guardan una sola vez en un PoolTextos (texto -> id y
+  id -> texto) con conteo de usos; las URLs y horas repetidas se comparten.
+- Los slots borrados se encadenan en una lista libre (por el arreglo next)
+  y se reutilizan al agregar.
+- Igual que HistorialNavegacion, se mantienen cadenas por URL y por título
+  (también como índices) para que eliminar_pagina y buscar sean O(1).
+- Misma API: agregar_pagina, retroceder, avanzar, eliminar_pagina, buscar y
+  mostrar_historial. Las páginas se devuelven como vistas Pagina.
+"""
+
+from array import array
+from typing import Dict, List, Optional
+
+NADA = -1
+
+
+class Pagina:
+    """Vista de solo lectura de una página (mismo formato que NodoPagina)."""
+
+    __slots__ = ("url", "titulo", "hora")
+
+    def __init__(self, url: str, titulo: str, hora: str):
+        self.url = url
+        self.titulo = titulo
+        self.hora = hora
+
+    def __repr__(self):
+        return f"({self.url}, '{self.titulo}', {self.hora})"
+
+    def __eq__(self, otra):
+        return isinstance(otra, Pagina) and (self.url, self.titulo, self.hora) == (otra.url, otra.titulo, otra.hora)
+
+
+class PoolTextos:
+    """Textos compartidos por id, con conteo de usos y reutilización de ids."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.textos: List[Optional[str]] = []
+        self.usos = array("q")
+        self.libres: List[int] = []
+
+    def usar(self, texto: str) -> int:
+        i = self.ids.get(texto)
+        if i is None:
+            if self.libres:
+                i = self.libres.pop()
+                self.textos[i] = texto
+                self.usos[i] = 0
+            else:
+                i = len(self.textos)
+                self.textos.append(texto)
+                self.usos.append(0)
+            self.ids[texto] = i
+        self.usos[i] += 1
+        return i
+
+    def soltar(self, i: int) -> None:
+        self.usos[i] -= 1
+        if self.usos[i] == 0:
+            del self.ids[self.textos[i]]
+            self.textos[i] = None
+            self.libres.append(i)
+
+
+class HistorialArreglos:
+    def __init__(self):
+        self.prev = array("q")
+        self.next = array("q")
+        self.url = array("q")
+        self.titulo = array("q")
+        self.hora = array("q")
+        self.orden = array("q")
+        # Cadenas de slots con la misma URL / el mismo título
+        self.prev_url = array("q")
+        self.next_url = array("q")
+        self.prev_titulo = array("q")
+        self.next_titulo = array("q")
+        # Primer y último slot de cada cadena, indexados por id del texto
+        self.primero_url = array("q")
+        self.ultimo_url = array("q")
+        self.primero_titulo = array("q")
+        self.ultimo_titulo = array("q")
+
+        self.urls = PoolTextos()
+        self.titulos = PoolTextos()
+        self.horas = PoolTextos()
+
+        self.head = self.tail = self.current = NADA
+        self.libre = NADA  # primer slot libre (encadenados por self.next)
+        self.cantidad = 0
+        self._contador = 0
+
+    # --------------------------
+    # Slots e índices
+    # --------------------------
+    def _nuevo_slot(self) -> int:
+        if self.libre != NADA:
+            slot = self.libre
+            self.libre = self.next[slot]
+            return slot
+        for columna in (self.prev, self.next, self.url, self.titulo, self.hora, self.orden,
+                        self.prev_url, self.next_url, self.prev_titulo, self.next_titulo):
+            columna.append(NADA)
+        return len(self.prev) - 1
+
+    @staticmethod
+    def _asegurar(arreglo: array, i: int) -> None:
+        if i >= len(arreglo):
+            arreglo.extend([NADA] * (i + 1 - len(arreglo)))
+
+    def _encadenar(self, slot: int, clave: int, anteriores: array, siguientes: array,
+                   primeros: array, ultimos: array) -> None:
+        self._asegurar(primeros, clave)
+        self._asegurar(ultimos, clave)
+        ultimo = ultimos[clave]
+        anteriores[slot] = ultimo
+        siguientes[slot] = NADA
+        if ultimo == NADA:
+            primeros[clave] = slot
+        else:
+            siguientes[ultimo] = slot
+        ultimos[clave] = slot
+
+    @staticmethod
+    def _desencadenar(slot: int, clave: int, anteriores: array, siguientes: array,
+                      primeros: array, ultimos: array) -> None:
+        anterior, siguiente = anteriores[slot], siguientes[slot]
+        if anterior == NADA:
+            primeros[clave] = siguiente
+        else:
+            siguientes[anterior] = siguiente
+        if siguiente == NADA:
+            ultimos[clave] = anterior
+        else:
+            anteriores[siguiente] = anterior
+
+    def _pagina(self, slot: int) -> Optional[Pagina]:
+        if slot == NADA:
+            return None
+        return Pagina(self.urls.textos[self.url[slot]], self.titulos.textos[self.titulo[slot]],
+                      self.horas.textos[self.hora[slot]])
+
+    # a) Agregar nueva página al final
+    def agregar_pagina(self, url: str, titulo: str, hora: str) -> None:
+        slot = self._nuevo_slot()
+        id_url, id_titulo = self.urls.usar(url), self.titulos.usar(titulo)
+        self.url[slot], self.titulo[slot], self.hora[slot] = id_url, id_titulo, self.horas.usar(hora)
+        self.orden[slot] = self._contador
+        self._contador += 1
+
+        self.prev[slot] = self.tail
+        self.next[slot] = NADA
+        if self.tail == NADA:  # lista vacía
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+
+        self._encadenar(slot, id_url, self.prev_url, self.next_url, self.primero_url, self.ultimo_url)
+        self._encadenar(slot, id_titulo, self.prev_titulo, self.next_titulo,
+                        self.primero_titulo, self.ultimo_titulo)
+        self.cantidad += 1
+        self.current = slot  # mover al final como "página actual"
+
+    # b) Retroceder en el historial
+    def retroceder(self) -> Optional[Pagina]:
+        if self.current != NADA and self.prev[self.current] != NADA:
+            self.current = self.prev[self.current]
+            return self._pagina(self.current)
+        return None
+
+    # c) Avanzar en el historial
+    def avanzar(self) -> Optional[Pagina]:
+        if self.current != NADA and self.next[self.current] != NADA:
+            self.current = self.next[self.current]
+            return self._pagina(self.current)
+        return None
+
+    # d) Eliminar una página por su URL (la primera desde el inicio), O(1)
+    def eliminar_pagina(self, url: str) -> bool:
+        id_url = self.urls.ids.get(url)
+        if id_url is None:
+            return False
+        slot = self.primero_url[id_url]
+        anterior, siguiente = self.prev[slot], self.next[slot]
+        if anterior == NADA:
+            self.head = siguiente
+        else:
+            self.next[anterior] = siguiente
+        if siguiente == NADA:
+            self.tail = anterior
+        else:
+            self.prev[siguiente] = anterior
+        # si borramos la actual, mover current
+        if self.current == slot:
+            self.current = anterior if anterior != NADA else siguiente
+
+        id_titulo = self.titulo[slot]
+        self._desencadenar(slot, id_url, self.prev_url, self.next_url, self.primero_url, self.ultimo_url)
+        self._desencadenar(slot, id_titulo, self.prev_titulo, self.next_titulo,
+                           self.primero_titulo, self.ultimo_titulo)
+        self.urls.soltar(id_url)
+        self.titulos.soltar(id_titulo)
+        self.horas.soltar(self.hora[slot])
+
+        self.next[slot] = self.libre
+        self.libre = slot
+        self.cantidad -= 1
+        return True
+
+    # e) Buscar página por URL o título (la primera desde el inicio), O(1)
+    def buscar(self, clave: str) -> Optional[Pagina]:
+        id_url, id_titulo = self.urls.ids.get(clave), self.titulos.ids.get(clave)
+        por_url = self.primero_url[id_url] if id_url is not None else NADA
+        por_titulo = self.primero_titulo[id_titulo] if id_titulo is not None else NADA
+        if por_url == NADA or (por_titulo != NADA and self.orden[por_titulo] < self.orden[por_url]):
+            return self._pagina(por_titulo)
+        return self._pagina(por_url)
+
+    # f) Mostrar historial completo
+    def mostrar_historial(self) -> None:
+        slot = self.head
+        historial = []
+        while slot != NADA:
+            marcador = " <= [Actual]" if slot == self.current else ""
+            historial.append(f"{self._pagina(slot)}{marcador}")
+            slot = self.next[slot]
+        print(" ←→ ".join(historial))
+
+
+# --------------------------
+# Ejemplo de uso
+# --------------------------
+if __name__ == "__main__":
+    historial = HistorialArreglos()
+    historial.agregar_pagina("google.com", "Google", "10:00 AM")
+    historial.agregar_pagina("wikipedia.org", "Wikipedia", "10:05 AM")
+    historial.agregar_pagina("github.com", "GitHub", "10:10 AM")
+    historial.agregar_pagina("stackoverflow.com", "Stack Overflow", "10:15 AM")
+
+    print("=== Historial inicial ===")
+    historial.mostrar_historial()
+
+    print("\nRetroceder:", historial.retroceder())
+    print("Eliminar github.com:", historial.eliminar_pagina("github.com"))
+    historial.mostrar_historial()
+    print("Buscar 'Wikipedia':", historial.buscar("Wikipedia"))
+
+    historial.agregar_pagina("openai.com", "OpenAI", "10:20 AM")  # reutiliza el slot libre
+    historial.mostrar_historial()
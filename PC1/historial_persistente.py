@@ -0,0 +1,422 @@
+"""
+Persistencia del historial de navegación con un log binario de solo-agregado.
+
+Problema:
+- Reconstruir HistorialNavegacion desde JSON llamando a agregar_pagina por
+  registro es muy lento con millones de entradas, y el historial debe
+  sobrevivir a reinicios.
+
+Decisiones:
+- Cada operación (agregar, eliminar, retroceder, avanzar) se agrega a
+  'historial.log' como un registro binario compacto:
+      'A' + longitudes (3 x uint16) + url, título y hora en UTF-8
+      'D' + longitud (uint16) + url
+      'R' (retroceder) / 'F' (avanzar): un solo byte
+      'J' + marca (int64): ir_a_hora ya resuelto a una marca numérica
+- Al iniciar se lee la instantánea y luego se reproduce el log con un
+  lector sobre mmap (struct.unpack_from, sin copiar el archivo).
+- compactar() escribe 'historial.snap' con las páginas vivas (con su marca
+  de tiempo, para que las marcas no cambien al reabrir), la página actual y
+  la última marca asignada, y empieza un log vacío. Cada archivo lleva un
+  número de generación: si el proceso se corta entre los dos pasos, el log
+  viejo (ya incluido en la instantánea) se ignora al reabrir.
+- La instantánea es columnar: marcas (int64) y largos en caracteres
+  (uint32) como arreglos, y URLs, títulos y horas como tres bloques UTF-8.
+  Al abrir, cada columna se decodifica de una vez y _cargar_paginas arma
+  la lista, las cadenas URL/título, el índice de tiempo y los bytes en una
+  sola pasada, sin _indexar por página.
+"""
+
+import gc
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate
+from typing import List, Optional, Sequence
+
+from pc1_2 import HistorialNavegacion, NodoPagina
+
+MAGIA_LOG = b"HLOG"
+MAGIA_SNAP = b"HSN2"
+MAGIA_SNAP_V1 = b"HSNP"  # formato anterior, sin marcas (se recalculan desde las horas)
+CABECERA = struct.Struct("<4sQ")  # magia, generación
+# magia, generación, páginas, índice actual, última marca y bytes de los bloques de URLs, títulos y horas
+CABECERA_SNAP = struct.Struct("<4sQQqqQQQ")
+CABECERA_SNAP_V1 = struct.Struct("<4sQQq")
+LONGITUDES = struct.Struct("<HHH")
+LONGITUD = struct.Struct("<H")
+MARCA = struct.Struct("<q")
+
+AGREGAR, ELIMINAR, RETROCEDER, AVANZAR, IR_A_HORA = b"A", b"D", b"R", b"F", b"J"
+
+
+def _columna(datos, posicion: int, tipo: str, cantidad: int) -> array:
+    """Lee 'cantidad' enteros little-endian de tipo 'tipo' desde 'posicion'."""
+    columna = array(tipo)
+    columna.frombytes(datos[posicion:posicion + cantidad * columna.itemsize])
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return columna
+
+def _bytes_le(columna: array) -> bytes:
+    if sys.byteorder == "big":
+        columna = array(columna.typecode, columna)
+        columna.byteswap()
+    return columna.tobytes()
+
+def _partir(texto: str, largos: Sequence[int]) -> List[str]:
+    """Corta un bloque de texto en trozos con esos largos (en caracteres)."""
+    cortes = list(accumulate(largos, initial=0))
+    return [texto[i:j] for i, j in zip(cortes, cortes[1:])]
+
+U32 = "I" if array("I").itemsize == 4 else "L"
+
+
+def _codificar(*textos: str) -> List[bytes]:
+    datos = [t.encode("utf-8") for t in textos]
+    if any(len(d) > 0xFFFF for d in datos):
+        raise ValueError("URL, título u hora demasiado largos para el log (máximo 65535 bytes)")
+    return datos
+
+
+class HistorialPersistente(HistorialNavegacion):
+    """
+    HistorialNavegacion que registra cada cambio en disco y se restaura al abrirlo.
+    directorio: carpeta con 'historial.log' y 'historial.snap'.
+    compactar_cada: si se indica, compacta automáticamente cada N operaciones.
+    El resto de opciones (max_paginas, max_bytes, ...) pasan a HistorialNavegacion.
+    """
+
+    def __init__(self, directorio: str, compactar_cada: Optional[int] = None, **opciones):
+        super().__init__(**opciones)
+        os.makedirs(directorio, exist_ok=True)
+        self.ruta_log = os.path.join(directorio, "historial.log")
+        self.ruta_snap = os.path.join(directorio, "historial.snap")
+        self.compactar_cada = compactar_cada
+        self.operaciones_en_log = 0
+        self.generacion = 0
+        self._log = None
+
+        self._cargar_instantanea()
+        if self._reproducir_log():
+            self._log = open(self.ruta_log, "ab")
+        else:
+            self._nuevo_log(self.generacion)
+
+    # --------------------------
+    # Escritura
+    # --------------------------
+    def _registrar(self, registro: bytes) -> None:
+        if self._log is None:  # reproduciendo al abrir
+            return
+        self._log.write(registro)
+        self.operaciones_en_log += 1
+        if self.compactar_cada and self.operaciones_en_log >= self.compactar_cada:
+            self.compactar()
+
+    def agregar_pagina(self, url: str, titulo: str, hora: str) -> None:
+        datos = _codificar(url, titulo, hora)
+        super().agregar_pagina(url, titulo, hora)
+        self._registrar(AGREGAR + LONGITUDES.pack(*map(len, datos)) + b"".join(datos))
+
+    def eliminar_pagina(self, url: str) -> bool:
+        eliminada = super().eliminar_pagina(url)
+        if eliminada:
+            dato, = _codificar(url)
+            self._registrar(ELIMINAR + LONGITUD.pack(len(dato)) + dato)
+        return eliminada
+
+    def retroceder(self) -> Optional[NodoPagina]:
+        nodo = super().retroceder()
+        if nodo is not None:
+            self._registrar(RETROCEDER)
+        return nodo
+
+    def avanzar(self) -> Optional[NodoPagina]:
+        nodo = super().avanzar()
+        if nodo is not None:
+            self._registrar(AVANZAR)
+        return nodo
+
+    def ir_a_hora(self, hora) -> Optional[NodoPagina]:
+        nodo = super().ir_a_hora(hora)
+        if nodo is not None:
+            # Se registra la marca resuelta: al reproducir lleva al mismo nodo
+            self._registrar(IR_A_HORA + MARCA.pack(self._marca(hora)))
+        return nodo
+
+    def sincronizar(self) -> None:
+        """Fuerza a disco lo registrado hasta ahora."""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+    def cerrar(self) -> None:
+        if self._log is not None:
+            self.sincronizar()
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> "HistorialPersistente":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    # --------------------------
+    # Compactación
+    # --------------------------
+    def compactar(self) -> None:
+        """Escribe una instantánea del estado actual y empieza un log vacío."""
+        generacion = self.generacion + 1
+        urls: List[str] = []
+        titulos: List[str] = []
+        horas: List[str] = []
+        marcas = array("q")
+        actual = -1
+        nodo = self.head
+        while nodo:
+            if nodo is self.current:
+                actual = len(urls)
+            urls.append(nodo.url)
+            titulos.append(nodo.titulo)
+            horas.append(nodo.hora)
+            marcas.append(nodo.marca)
+            nodo = nodo.next
+        largos = array(U32, map(len, urls))
+        largos.extend(map(len, titulos))
+        largos.extend(map(len, horas))
+        bloques = ["".join(columna).encode("utf-8") for columna in (urls, titulos, horas)]
+
+        temporal = self.ruta_snap + ".tmp"
+        with open(temporal, "wb") as f:
+            f.write(CABECERA_SNAP.pack(MAGIA_SNAP, generacion, len(urls), actual, self._ultima_marca,
+                                       *map(len, bloques)))
+            f.write(_bytes_le(marcas))
+            f.write(_bytes_le(largos))
+            f.writelines(bloques)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta_snap)
+
+        # Recién ahora se descarta el log viejo (ya incluido en la instantánea)
+        self._nuevo_log(generacion)
+        self.generacion = generacion
+        self.operaciones_en_log = 0
+
+    def _nuevo_log(self, generacion: int) -> None:
+        """Reemplaza el log por uno vacío de esa generación y lo deja abierto."""
+        if self._log is not None:
+            self._log.close()
+        temporal = self.ruta_log + ".tmp"
+        with open(temporal, "wb") as f:
+            f.write(CABECERA.pack(MAGIA_LOG, generacion))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta_log)
+        self._log = open(self.ruta_log, "ab")
+
+    # --------------------------
+    # Lectura al abrir
+    # --------------------------
+    def _cargar_instantanea(self) -> None:
+        if not os.path.exists(self.ruta_snap):
+            return
+        # Millones de nodos nuevos dispararían recolecciones completas que no
+        # pueden liberar nada: se pausa el GC mientras se arma el historial
+        reactivar = gc.isenabled()
+        gc.disable()
+        try:
+            self._leer_instantanea()
+        finally:
+            if reactivar:
+                gc.enable()
+
+    def _leer_instantanea(self) -> None:
+        with open(self.ruta_snap, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            magia = datos[:4]
+            if magia == MAGIA_SNAP_V1:
+                self._cargar_instantanea_v1(datos)
+                return
+            if magia != MAGIA_SNAP:
+                raise ValueError(f"{self.ruta_snap} no es una instantánea de historial")
+            (_, self.generacion, cantidad, actual, ultima_marca,
+             *tamanos) = CABECERA_SNAP.unpack_from(datos, 0)
+            posicion = CABECERA_SNAP.size
+            marcas = _columna(datos, posicion, "q", cantidad)
+            posicion += len(marcas) * marcas.itemsize
+            largos = _columna(datos, posicion, U32, 3 * cantidad)
+            posicion += len(largos) * largos.itemsize
+            columnas = []
+            for i, tamano in enumerate(tamanos):
+                texto = datos[posicion:posicion + tamano].decode("utf-8")
+                columnas.append(_partir(texto, largos[i * cantidad:(i + 1) * cantidad]))
+                posicion += tamano
+        self._cargar_paginas(*columnas, marcas, actual, ultima_marca)
+
+    def _cargar_instantanea_v1(self, datos) -> None:
+        """Formato anterior: un registro por página y sin marcas."""
+        _, self.generacion, cantidad, actual = CABECERA_SNAP_V1.unpack_from(datos, 0)
+        posicion = CABECERA_SNAP_V1.size
+        urls, titulos, horas = [], [], []
+        for _ in range(cantidad):
+            lu, lt, lh = LONGITUDES.unpack_from(datos, posicion)
+            posicion += LONGITUDES.size
+            urls.append(datos[posicion:posicion + lu].decode("utf-8"))
+            posicion += lu
+            titulos.append(datos[posicion:posicion + lt].decode("utf-8"))
+            posicion += lt
+            horas.append(datos[posicion:posicion + lh].decode("utf-8"))
+            posicion += lh
+        self._cargar_paginas(urls, titulos, horas, None, actual, None)
+
+    def _cargar_paginas(self, urls: List[str], titulos: List[str], horas: List[str],
+                        marcas: Optional[array], actual: int, ultima_marca: Optional[int]) -> None:
+        """
+        Arma de una vez el historial (vacío) con las páginas de la instantánea,
+        sin pasar por el log ni por _indexar/bytes_aproximados por página.
+        Sin marcas (formato anterior) se recalculan desde las horas.
+        """
+        nodos = list(map(NodoPagina, urls, titulos, horas))
+        if not nodos:
+            return
+        if marcas is None:
+            for nodo in nodos:
+                self._asignar_marca(nodo)
+            marcas = array("q", (nodo.marca for nodo in nodos))
+        else:
+            self._ultima_marca = ultima_marca
+
+        # Lista y cadenas URL/título en una sola pasada
+        por_url, por_titulo = self.por_url, self.por_titulo
+        primero = orden = self._contador
+        anterior = None
+        for nodo, marca in zip(nodos, marcas):
+            nodo.orden = orden
+            orden += 1
+            nodo.marca = marca
+            if anterior is not None:
+                anterior.next = nodo
+                nodo.prev = anterior
+            anterior = nodo
+
+            extremos = por_url.get(nodo.url)
+            if extremos is None:
+                por_url[nodo.url] = [nodo, nodo]
+            else:
+                extremos[1].next_url = nodo
+                nodo.prev_url = extremos[1]
+                extremos[1] = nodo
+            extremos = por_titulo.get(nodo.titulo)
+            if extremos is None:
+                por_titulo[nodo.titulo] = [nodo, nodo]
+            else:
+                extremos[1].next_titulo = nodo
+                nodo.prev_titulo = extremos[1]
+                extremos[1] = nodo
+        self.head, self.tail = nodos[0], nodos[-1]
+        self._contador = orden
+        self.cantidad = len(nodos)
+
+        # Índice de tiempo: las marcas ya vienen ordenadas
+        self._marcas.extend(marcas)
+        self._ordenes.extend(range(primero, orden))
+        self._vivo_anterior.extend(range(len(self._por_tiempo), len(self._por_tiempo) + len(nodos)))
+        self._por_tiempo.extend(nodos)
+
+        # Bytes: todos los nodos miden lo mismo; URL/hora compartidas cuentan una vez
+        self.bytes_usados += sys.getsizeof(nodos[0]) * len(nodos) + sum(map(sys.getsizeof, titulos))
+        usos = Counter(urls)
+        usos.update(horas)
+        for texto, veces in usos.items():
+            if texto not in self._usos_compartidos:
+                self.bytes_usados += sys.getsizeof(texto)
+            self._usos_compartidos[texto] = self._usos_compartidos.get(texto, 0) + veces
+
+        if self.busqueda is not None:
+            for nodo in nodos:
+                self.busqueda.agregar(nodo)
+        if actual >= 0:
+            self.current = nodos[actual]
+        self._desalojar()
+
+    def _reproducir_log(self) -> bool:
+        """Aplica el log sobre la instantánea. Devuelve False si no hay log útil."""
+        if not os.path.exists(self.ruta_log) or os.path.getsize(self.ruta_log) < CABECERA.size:
+            return False
+        with open(self.ruta_log, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            magia, generacion = CABECERA.unpack_from(datos, 0)
+            if magia != MAGIA_LOG:
+                raise ValueError(f"{self.ruta_log} no es un log de historial")
+            if generacion < self.generacion:
+                return False  # log anterior a la instantánea: ya está incluido
+            posicion, fin = CABECERA.size, len(datos)
+            valido = fin
+            while posicion < fin:
+                valido = posicion
+                operacion = datos[posicion:posicion + 1]
+                posicion += 1
+                if operacion == AGREGAR:
+                    if posicion + LONGITUDES.size > fin:
+                        break  # registro cortado por una caída: se descarta
+                    lu, lt, lh = LONGITUDES.unpack_from(datos, posicion)
+                    posicion += LONGITUDES.size
+                    if posicion + lu + lt + lh > fin:
+                        break
+                    url = datos[posicion:posicion + lu].decode("utf-8")
+                    posicion += lu
+                    titulo = datos[posicion:posicion + lt].decode("utf-8")
+                    posicion += lt
+                    hora = datos[posicion:posicion + lh].decode("utf-8")
+                    posicion += lh
+                    self.agregar_pagina(url, titulo, hora)
+                elif operacion == ELIMINAR:
+                    if posicion + LONGITUD.size > fin:
+                        break
+                    lu, = LONGITUD.unpack_from(datos, posicion)
+                    posicion += LONGITUD.size
+                    if posicion + lu > fin:
+                        break
+                    self.eliminar_pagina(datos[posicion:posicion + lu].decode("utf-8"))
+                    posicion += lu
+                elif operacion == RETROCEDER:
+                    self.retroceder()
+                elif operacion == AVANZAR:
+                    self.avanzar()
+                elif operacion == IR_A_HORA:
+                    if posicion + MARCA.size > fin:
+                        break
+                    marca, = MARCA.unpack_from(datos, posicion)
+                    posicion += MARCA.size
+                    self.ir_a_hora(marca)
+                else:
+                    raise ValueError(f"Registro desconocido {operacion!r} en {self.ruta_log}")
+                self.operaciones_en_log += 1
+                valido = posicion
+        if valido < fin:
+            # Se descarta el último registro incompleto para seguir agregando detrás
+            os.truncate(self.ruta_log, valido)
+        self.generacion = generacion
+        return True
+
+
+# --------------------------
+# Ejemplo de uso
+# --------------------------
+if __name__ == "__main__":
+    import tempfile
+
+    carpeta = tempfile.mkdtemp(prefix="historial_")
+    with HistorialPersistente(carpeta) as historial:
+        historial.agregar_pagina("google.com", "Google", "10:00 AM")
+        historial.agregar_pagina("wikipedia.org", "Wikipedia", "10:05 AM")
+        historial.compactar()
+        historial.agregar_pagina("github.com", "GitHub", "10:10 AM")
+        historial.eliminar_pagina("google.com")
+        historial.retroceder()
+
+    print("=== Historial restaurado desde", carpeta, "===")
+    with HistorialPersistente(carpeta) as restaurado:
+        restaurado.mostrar_historial()
@@ -0,0 +1,184 @@
+"""
+Índice de búsqueda incremental por prefijo y por subcadena para el historial.
+
+Problema:
+- HistorialNavegacion.buscar solo encuentra una URL o un título exactos, y
+  los usuarios escriben consultas parciales como "git" u "overfl".
+
+Decisiones:
+- Prefijos: un trie sobre la URL completa y sobre cada palabra del título
+  (hasta PROFUNDIDAD caracteres; para prefijos más largos se verifica el
+  texto de los candidatos).
+- Subcadenas: un índice de n-gramas (n = 1, 2, 3) de URL y título. Una
+  consulta de hasta 3 caracteres es directamente un n-grama; una más larga
+  recorre la lista del trigrama menos frecuente y verifica cada candidato.
+- Cada lista de resultados (nodo del trie o n-grama) guarda las páginas en
+  orden de llegada, así los k más recientes (o más antiguos) salen del
+  final (o del inicio) sin ordenar nada.
+- Borrar una página solo la quita del conjunto de vivas; las listas se
+  limpian cuando la mitad de sus entradas son páginas borradas. Cuando una
+  lista se queda sin páginas vivas se borra su n-grama, y los nodos del
+  trie sin páginas ni hijos se podan, así el índice no crece con las
+  páginas que ya salieron del historial.
+- El texto se compara sin distinguir mayúsculas (casefold).
+"""
+
+from itertools import islice
+from typing import Dict, Iterator, List, Set
+
+PROFUNDIDAD = 16
+
+
+class Postings:
+    """Páginas que contienen una clave, en orden de llegada (con borrados perezosos)."""
+
+    __slots__ = ("paginas", "muertas")
+
+    def __init__(self):
+        self.paginas: List = []
+        self.muertas = 0
+
+    def vacia(self) -> bool:
+        return len(self.paginas) == self.muertas
+
+    def recorrer(self, vivas: Set, recientes: bool) -> Iterator:
+        paginas = reversed(self.paginas) if recientes else iter(self.paginas)
+        return (p for p in paginas if p in vivas)
+
+
+class NodoTrie:
+    __slots__ = ("hijos", "postings")
+
+    def __init__(self):
+        self.hijos: Dict[str, "NodoTrie"] = {}
+        self.postings = Postings()
+
+
+class IndiceBusqueda:
+    """Índice de prefijos (trie) y subcadenas (n-gramas) sobre nodos con url y titulo."""
+
+    def __init__(self):
+        self.raiz = NodoTrie()
+        self.gramas: Dict[str, Postings] = {}
+        self.vivas: Set = set()
+
+    # --------------------------
+    # Claves de una página
+    # --------------------------
+    @staticmethod
+    def _textos(pagina) -> List[str]:
+        return [pagina.url.casefold(), pagina.titulo.casefold()]
+
+    def _palabras(self, pagina) -> Set[str]:
+        url, titulo = self._textos(pagina)
+        return {url[:PROFUNDIDAD]} | {p[:PROFUNDIDAD] for p in titulo.split()}
+
+    def _gramas(self, pagina) -> Set[str]:
+        gramas = set()
+        for texto in self._textos(pagina):
+            for n in (1, 2, 3):
+                gramas.update(texto[i:i + n] for i in range(len(texto) - n + 1))
+        return gramas
+
+    def _nodos_trie(self, pagina, crear: bool) -> Set[NodoTrie]:
+        """Nodos del trie por los que pasa alguna palabra de la página (sin repetir)."""
+        nodos = set()
+        for palabra in self._palabras(pagina):
+            nodo = self.raiz
+            for letra in palabra:
+                hijo = nodo.hijos.get(letra)
+                if hijo is None:
+                    if not crear:
+                        break
+                    hijo = nodo.hijos[letra] = NodoTrie()
+                nodo = hijo
+                nodos.add(nodo)
+        return nodos
+
+    # --------------------------
+    # Mantenimiento
+    # --------------------------
+    def agregar(self, pagina) -> None:
+        """Indexa una página nueva (las páginas deben llegar en orden de historial)."""
+        self.vivas.add(pagina)
+        for nodo in self._nodos_trie(pagina, crear=True):
+            nodo.postings.paginas.append(pagina)
+        for grama in self._gramas(pagina):
+            postings = self.gramas.get(grama)
+            if postings is None:
+                postings = self.gramas[grama] = Postings()
+            postings.paginas.append(pagina)
+
+    def eliminar(self, pagina) -> None:
+        self.vivas.discard(pagina)
+        for nodo in self._nodos_trie(pagina, crear=False):
+            self._marcar_muerta(nodo.postings)
+        self._podar(pagina)
+        for grama in self._gramas(pagina):
+            postings = self.gramas[grama]
+            self._marcar_muerta(postings)
+            if postings.vacia():
+                del self.gramas[grama]
+
+    def _podar(self, pagina) -> None:
+        """Quita, desde las hojas, los nodos de las palabras de la página sin páginas ni hijos."""
+        for palabra in self._palabras(pagina):
+            camino = []
+            nodo = self.raiz
+            for letra in palabra:
+                hijo = nodo.hijos.get(letra)
+                if hijo is None:  # ya podado por otra palabra de la página
+                    break
+                camino.append((nodo, letra, hijo))
+                nodo = hijo
+            for padre, letra, hijo in reversed(camino):
+                if hijo.hijos or not hijo.postings.vacia():
+                    break
+                del padre.hijos[letra]
+
+    def _marcar_muerta(self, postings: Postings) -> None:
+        postings.muertas += 1
+        if 2 * postings.muertas > len(postings.paginas):
+            postings.paginas = [p for p in postings.paginas if p in self.vivas]
+            postings.muertas = 0
+
+    # --------------------------
+    # Consultas
+    # --------------------------
+    def buscar_prefijo(self, consulta: str, k: int = 10, recientes: bool = True) -> List:
+        """Hasta k páginas cuya URL o alguna palabra del título empieza con la consulta."""
+        consulta = consulta.casefold()
+        nodo = self.raiz
+        for letra in consulta[:PROFUNDIDAD]:
+            nodo = nodo.hijos.get(letra)
+            if nodo is None:
+                return []
+        candidatas = nodo.postings.recorrer(self.vivas, recientes)
+        if len(consulta) > PROFUNDIDAD:
+            candidatas = (p for p in candidatas
+                          if any(palabra.startswith(consulta) for palabra in self._palabras_completas(p)))
+        return self._primeras(candidatas, k)
+
+    def buscar_subcadena(self, consulta: str, k: int = 10, recientes: bool = True) -> List:
+        """Hasta k páginas cuya URL o título contiene la consulta."""
+        consulta = consulta.casefold()
+        if not consulta:
+            return []
+        if len(consulta) <= 3:
+            postings = self.gramas.get(consulta)
+            return self._primeras(postings.recorrer(self.vivas, recientes), k) if postings else []
+        trigramas = [self.gramas.get(consulta[i:i + 3]) for i in range(len(consulta) - 2)]
+        if any(t is None for t in trigramas):
+            return []
+        menor = min(trigramas, key=lambda t: len(t.paginas))
+        candidatas = (p for p in menor.recorrer(self.vivas, recientes)
+                      if any(consulta in texto for texto in self._textos(p)))
+        return self._primeras(candidatas, k)
+
+    def _palabras_completas(self, pagina) -> List[str]:
+        url, titulo = self._textos(pagina)
+        return [url] + titulo.split()
+
+    @staticmethod
+    def _primeras(candidatas: Iterator, k: int) -> List:
+        return list(islice(candidatas, max(k, 0)))
@@ -0,0 +1,179 @@
+"""
+Ordenamiento externo (out-of-core) de cursos por hora de inicio.
+
+Problema:
+- Los archivos históricos de horarios (JSONL/CSV) pesan varios GB y no caben
+  en memoria, así que merge_sort/merge de pc1_1.py no sirven directamente.
+
+Decisiones:
+- Se leen los cursos como un stream y se acumulan corridas acotadas por un
+  presupuesto de memoria (memoria_mb); cada corrida se ordena en memoria con
+  la misma rutina de merge_sort_paralelo y se vuelca a un archivo temporal.
+- Las corridas se fusionan de forma perezosa con un merge de k vías
+  (heapq.merge). Si hay más de 'max_abiertos' corridas se fusionan por
+  pasadas, para no abrir demasiados archivos a la vez.
+- Cada registro viaja con su posición en la entrada, que desempata claves
+  iguales: el resultado es el mismo que el de la versión serial estable.
+- En memoria solo vive una corrida o un registro por corrida en el merge,
+  así que el pico de memoria no depende del tamaño de la entrada.
+"""
+
+import csv
+import heapq
+import json
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pc1_1 import _ordenar_chunk, clave_hora_inicio
+
+Registro = Tuple[Any, int, Dict]  # (clave, posición en la entrada, curso)
+
+
+# --------------------------
+# Lectura y escritura en streaming
+# --------------------------
+def leer_cursos(ruta: str) -> Iterator[Dict]:
+    """Lee cursos uno a uno desde un archivo .csv (con encabezado) o JSONL."""
+    with open(ruta, encoding="utf-8", newline="") as f:
+        if ruta.endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for linea in f:
+                if linea.strip():
+                    yield json.loads(linea)
+
+def escribir_cursos(cursos: Iterable[Dict], ruta: str) -> int:
+    """Escribe cursos en .csv o JSONL según la extensión. Devuelve cuántos escribió."""
+    total = 0
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        if ruta.endswith(".csv"):
+            escritor = None
+            for curso in cursos:
+                if escritor is None:
+                    escritor = csv.DictWriter(f, fieldnames=list(curso))
+                    escritor.writeheader()
+                escritor.writerow(curso)
+                total += 1
+        else:
+            for curso in cursos:
+                f.write(json.dumps(curso, ensure_ascii=False))
+                f.write("\n")
+                total += 1
+    return total
+
+def _tamano_aproximado(curso: Dict) -> int:
+    """Bytes aproximados que ocupa un curso en memoria."""
+    return sys.getsizeof(curso) + sum(sys.getsizeof(v) for v in curso.values())
+
+
+# --------------------------
+# Corridas en disco
+# --------------------------
+def _volcar_corrida(bloque: List[Dict], claves: List[Any], inicio: int, directorio: str) -> str:
+    """Ordena un bloque en memoria y lo guarda como corrida de registros pickle."""
+    descriptor, ruta = tempfile.mkstemp(suffix=".corrida", dir=directorio)
+    with os.fdopen(descriptor, "wb") as f:
+        for clave, posicion in _ordenar_chunk(claves, inicio):
+            pickle.dump((clave, posicion, bloque[posicion - inicio]), f, pickle.HIGHEST_PROTOCOL)
+    return ruta
+
+def _leer_corrida(ruta: str) -> Iterator[Registro]:
+    with open(ruta, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def _generar_corridas(
+    cursos: Iterable[Dict], key: Callable[[Dict], Any], memoria_bytes: int, directorio: str
+) -> List[str]:
+    """Parte la entrada en corridas ordenadas que respetan el presupuesto de memoria."""
+    corridas = []
+    bloque, claves = [], []
+    usado = inicio = 0
+    for curso in cursos:
+        bloque.append(curso)
+        claves.append(key(curso))
+        usado += _tamano_aproximado(curso)
+        if usado >= memoria_bytes:
+            corridas.append(_volcar_corrida(bloque, claves, inicio, directorio))
+            inicio += len(bloque)
+            bloque, claves = [], []
+            usado = 0
+    if bloque:
+        corridas.append(_volcar_corrida(bloque, claves, inicio, directorio))
+    return corridas
+
+def _fusionar_corridas(corridas: List[str]) -> Iterator[Registro]:
+    # (clave, posición) es único, así que nunca se comparan los diccionarios
+    return heapq.merge(*(_leer_corrida(r) for r in corridas))
+
+
+# --------------------------
+# API
+# --------------------------
+def ordenar_externo(
+    cursos: Iterable[Dict],
+    key: Callable[[Dict], Any] = clave_hora_inicio,
+    memoria_mb: float = 64,
+    max_abiertos: int = 64,
+    directorio: Optional[str] = None,
+) -> Iterator[Dict]:
+    """
+    Generador que devuelve los cursos ordenados (estable) usando disco.
+    cursos: cualquier iterable, por ejemplo leer_cursos("horarios.jsonl").
+    memoria_mb: presupuesto aproximado de memoria para cada corrida.
+    max_abiertos: máximo de corridas fusionadas a la vez.
+    directorio: dónde crear los temporales (por defecto, el del sistema).
+    Los archivos temporales se borran al agotar o cerrar el generador.
+    """
+    # Se valida aquí (no dentro del generador) para fallar al llamar, no al iterar
+    if memoria_mb <= 0:
+        raise ValueError("memoria_mb debe ser mayor que 0")
+    if max_abiertos < 2:
+        raise ValueError("max_abiertos debe ser al menos 2 (con 1 las corridas nunca disminuyen)")
+    return _ordenar_externo(cursos, key, memoria_mb, max_abiertos, directorio)
+
+def _ordenar_externo(
+    cursos: Iterable[Dict], key: Callable[[Dict], Any], memoria_mb: float, max_abiertos: int,
+    directorio: Optional[str],
+) -> Iterator[Dict]:
+    with tempfile.TemporaryDirectory(prefix="ordenamiento_externo_", dir=directorio) as tmp:
+        corridas = _generar_corridas(cursos, key, int(memoria_mb * 1024 * 1024), tmp)
+
+        # Pasadas intermedias: fusiona grupos de corridas hasta que queden pocas
+        while len(corridas) > max_abiertos:
+            siguientes = []
+            for i in range(0, len(corridas), max_abiertos):
+                grupo = corridas[i:i + max_abiertos]
+                descriptor, ruta = tempfile.mkstemp(suffix=".corrida", dir=tmp)
+                with os.fdopen(descriptor, "wb") as f:
+                    for registro in _fusionar_corridas(grupo):
+                        pickle.dump(registro, f, pickle.HIGHEST_PROTOCOL)
+                for r in grupo:
+                    os.remove(r)
+                siguientes.append(ruta)
+            corridas = siguientes
+
+        for _, _, curso in _fusionar_corridas(corridas):
+            yield curso
+
+def ordenar_archivo(ruta_entrada: str, ruta_salida: str, **opciones) -> int:
+    """Ordena un archivo .csv/JSONL en otro archivo; devuelve cuántos cursos escribió."""
+    return escribir_cursos(ordenar_externo(leer_cursos(ruta_entrada), **opciones), ruta_salida)
+
+
+# --------------------------
+# Programa principal
+# --------------------------
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Uso: python ordenamiento_externo.py entrada.jsonl|csv salida.jsonl|csv [memoria_mb]")
+        sys.exit(1)
+    memoria = float(sys.argv[3]) if len(sys.argv) > 3 else 64
+    total = ordenar_archivo(sys.argv[1], sys.argv[2], memoria_mb=memoria)
+    print(f"{total} cursos ordenados en {sys.argv[2]}")
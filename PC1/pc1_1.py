@@ -10,7 +10,11 @@ Decisiones:
 - Usamos Búsqueda Binaria porque después de ordenar la lista, la búsqueda en O(log n) es posible.
 """
 
-from typing import List, Dict, Optional
+import heapq
+from bisect import bisect_left, bisect_right
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 # --------------------------
 # Algoritmo MergeSort
@@ -44,6 +48,100 @@ def merge(left: List[Dict], right: List[Dict]) -> List[Dict]:
     result.extend(right[j:])
     return result
 
+# --------------------------
+# MergeSort iterativo (bottom-up)
+# --------------------------
+def hora_a_minutos(hora: str) -> int:
+    """Convierte una hora "HH:MM" en minutos desde la medianoche."""
+    horas, minutos = hora.split(":")
+    return int(horas) * 60 + int(minutos)
+
+def clave_hora_inicio(curso: Dict) -> int:
+    """Clave por defecto: 'hora_inicio' del curso en minutos."""
+    return hora_a_minutos(curso["hora_inicio"])
+
+def merge_sort_iterativo(cursos: List[Dict], key: Callable[[Dict], Any] = clave_hora_inicio) -> List[Dict]:
+    """
+    Ordena los cursos con MergeSort bottom-up, sin recursión ni rebanadas.
+    - Las claves se calculan una sola vez por curso (por defecto la hora en minutos).
+    - Se fusionan corridas de ancho 1, 2, 4, ... alternando entre dos buffers
+      preasignados (uno de origen y otro de destino) en vez de crear listas nuevas.
+    - Es estable: ante claves iguales se toma primero el elemento de la izquierda.
+    """
+    n = len(cursos)
+    src_k = [key(c) for c in cursos]
+    src_v = list(cursos)
+    dst_k = [None] * n
+    dst_v = [None] * n
+
+    ancho = 1
+    while ancho < n:
+        for lo in range(0, n, 2 * ancho):
+            mid = min(lo + ancho, n)
+            hi = min(lo + 2 * ancho, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src_k[i] <= src_k[j]:
+                    dst_k[k] = src_k[i]
+                    dst_v[k] = src_v[i]
+                    i += 1
+                else:
+                    dst_k[k] = src_k[j]
+                    dst_v[k] = src_v[j]
+                    j += 1
+                k += 1
+            # Copiar el resto de la corrida que no se agotó
+            if i < mid:
+                dst_k[k:hi] = src_k[i:mid]
+                dst_v[k:hi] = src_v[i:mid]
+            else:
+                dst_k[k:hi] = src_k[j:hi]
+                dst_v[k:hi] = src_v[j:hi]
+        src_k, dst_k = dst_k, src_k
+        src_v, dst_v = dst_v, src_v
+        ancho *= 2
+
+    return src_v
+
+# --------------------------
+# MergeSort paralelo
+# --------------------------
+def _ordenar_chunk(claves: List[Any], inicio: int) -> List[Tuple[Any, int]]:
+    """Ordena (en un proceso del pool) un bloque de claves; devuelve (clave, índice global)."""
+    orden = merge_sort_iterativo(list(range(len(claves))), key=claves.__getitem__)
+    return [(claves[i], inicio + i) for i in orden]
+
+def merge_sort_paralelo(
+    cursos: List[Dict],
+    key: Callable[[Dict], Any] = clave_hora_inicio,
+    workers: Optional[int] = None,
+    tamano_chunk: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Ordena los cursos repartiendo bloques contiguos entre varios procesos.
+    - Las claves se calculan aquí una vez y a los procesos solo viajan las claves
+      (no los diccionarios completos).
+    - Cada proceso ordena su bloque con merge_sort_iterativo y devuelve pares
+      (clave, índice global); luego se combinan con un merge de k vías (heapq.merge).
+    - El índice global desempata claves iguales, así el resultado es idéntico al
+      de la versión serial estable.
+    workers: número de procesos (por defecto, los núcleos de la máquina).
+    tamano_chunk: cursos por bloque (por defecto, n / workers).
+    """
+    n = len(cursos)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < 2:
+        return merge_sort_iterativo(cursos, key)
+    tamano_chunk = tamano_chunk or -(-n // workers)
+
+    claves = [key(c) for c in cursos]
+    inicios = range(0, n, tamano_chunk)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        corridas = list(pool.map(_ordenar_chunk,
+                                 (claves[i:i + tamano_chunk] for i in inicios),
+                                 inicios))
+    return [cursos[i] for _, i in heapq.merge(*corridas)]
+
 # --------------------------
 # Búsqueda Binaria
 # --------------------------
@@ -64,6 +162,120 @@ def binary_search(cursos: List[Dict], hora: str) -> Optional[Dict]:
             high = mid - 1
     return None
 
+# --------------------------
+# Índice ordenado de cursos
+# --------------------------
+class IndiceCursos:
+    """
+    Índice de cursos ordenado por 'hora_inicio' que se mantiene al insertar y borrar.
+    - Los cursos se guardan en cubetas ordenadas de a lo sumo 2 * CARGA elementos;
+      una búsqueda binaria sobre el máximo de cada cubeta y otra dentro de la cubeta
+      ubican cualquier hora en O(log n), y solo se desplaza una cubeta acotada.
+    - La clave es (minutos, orden de inserción), así los cursos con la misma hora
+      quedan en orden de llegada (igual que con un MergeSort estable).
+    - 'codigo' identifica al curso: insertar un código existente lo reemplaza.
+    - Si se modifica 'hora_inicio' de un curso ya indexado, hay que reinsertarlo.
+    """
+
+    CARGA = 512
+
+    def __init__(self, cursos: List[Dict] = ()):
+        self._claves: List[List[Tuple[int, int]]] = []  # claves por cubeta
+        self._cursos: List[List[Dict]] = []  # cursos por cubeta (paralelo a _claves)
+        self._maximos: List[Tuple[int, int]] = []  # última clave de cada cubeta
+        self._por_codigo: Dict[Any, Tuple[int, int]] = {}
+        self._contador = 0
+
+        cursos = list(cursos)  # se recorre dos veces si hay códigos repetidos (puede ser un generador)
+        ordenados = merge_sort_iterativo(cursos)
+        claves = []
+        for curso in ordenados:
+            claves.append((clave_hora_inicio(curso), self._contador))
+            self._por_codigo[curso["codigo"]] = claves[-1]
+            self._contador += 1
+        if len(self._por_codigo) != len(ordenados):
+            # Códigos repetidos: el último reemplaza a los anteriores
+            self._por_codigo.clear()
+            self._contador = 0
+            for curso in cursos:
+                self.insertar(curso)
+            return
+        for i in range(0, len(ordenados), self.CARGA):
+            self._claves.append(claves[i:i + self.CARGA])
+            self._cursos.append(ordenados[i:i + self.CARGA])
+            self._maximos.append(self._claves[-1][-1])
+
+    def __len__(self) -> int:
+        return len(self._por_codigo)
+
+    def __iter__(self):
+        for cubeta in self._cursos:
+            yield from cubeta
+
+    def insertar(self, curso: Dict) -> None:
+        """Agrega un curso (o reemplaza el que tenga el mismo 'codigo')."""
+        self.eliminar(curso["codigo"])
+        clave = (clave_hora_inicio(curso), self._contador)
+        self._contador += 1
+        self._por_codigo[curso["codigo"]] = clave
+
+        if not self._maximos:
+            self._claves.append([clave])
+            self._cursos.append([curso])
+            self._maximos.append(clave)
+            return
+        i = min(bisect_left(self._maximos, clave), len(self._maximos) - 1)
+        claves, cursos = self._claves[i], self._cursos[i]
+        j = bisect_left(claves, clave)
+        claves.insert(j, clave)
+        cursos.insert(j, curso)
+        self._maximos[i] = claves[-1]
+
+        # Partir la cubeta si creció demasiado
+        if len(claves) > 2 * self.CARGA:
+            self._claves[i:i + 1] = [claves[:self.CARGA], claves[self.CARGA:]]
+            self._cursos[i:i + 1] = [cursos[:self.CARGA], cursos[self.CARGA:]]
+            self._maximos[i:i + 1] = [claves[self.CARGA - 1], claves[-1]]
+
+    def eliminar(self, codigo: Any) -> bool:
+        """Borra el curso con ese código. Devuelve False si no estaba."""
+        clave = self._por_codigo.pop(codigo, None)
+        if clave is None:
+            return False
+        i = bisect_left(self._maximos, clave)
+        claves, cursos = self._claves[i], self._cursos[i]
+        j = bisect_left(claves, clave)
+        del claves[j]
+        del cursos[j]
+        if claves:
+            self._maximos[i] = claves[-1]
+        else:
+            del self._claves[i], self._cursos[i], self._maximos[i]
+        return True
+
+    def range(self, desde: str, hasta: str) -> List[Dict]:
+        """Cursos con 'hora_inicio' entre desde y hasta (ambas incluidas), en orden."""
+        inferior = (hora_a_minutos(desde), -1)
+        superior = (hora_a_minutos(hasta), float("inf"))
+        resultado: List[Dict] = []
+        i = bisect_left(self._maximos, inferior)
+        if i == len(self._maximos):
+            return resultado
+        inicio = bisect_left(self._claves[i], inferior)
+        while i < len(self._claves):
+            claves = self._claves[i]
+            fin = bisect_right(claves, superior)
+            resultado.extend(self._cursos[i][inicio:fin])
+            if fin < len(claves):
+                break
+            i += 1
+            inicio = 0
+        return resultado
+
+    def find_all(self, hora: str) -> List[Dict]:
+        """Todos los cursos que empiezan a esa hora, en orden de inserción."""
+        return self.range(hora, hora)
+
 # --------------------------
 # Programa principal
 # --------------------------
@@ -97,3 +309,9 @@ if __name__ == "__main__":
     else:
         print("\nNo existe un curso a esa hora.")
 
+    # Índice ordenado: varias coincidencias y rangos de horas
+    indice = IndiceCursos(cursos)
+    indice.insertar({"codigo": "EST210", "nombre": "Estadística", "hora_inicio": "09:45"})
+    print("\nCursos a las 09:45:", indice.find_all("09:45"))
+    print("Cursos entre 09:00 y 11:30:", indice.range("09:00", "11:30"))
+
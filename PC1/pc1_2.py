@@ -9,43 +9,296 @@ c) Avanzar en el historial.
 d) Eliminar una página por su URL.
 e) Buscar una página por URL o título.
 f) Mostrar el historial completo.
+g) Consultar páginas por rango de horas y saltar a una hora.
 """
 
-from typing import Optional
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, TextIO, Union
+
+from indice_busqueda import IndiceBusqueda
+
+MINUTOS_DIA = 24 * 60
+
+
+@lru_cache(maxsize=4096)
+def hora_a_minutos(hora: str) -> Optional[int]:
+    """
+    Convierte "10:05 AM", "12:30 PM" o "18:00" a minutos desde medianoche.
+    Devuelve None si el texto no es una hora reconocible.
+    """
+    partes = hora.strip().upper().split()
+    if not 1 <= len(partes) <= 2 or (len(partes) == 2 and partes[1] not in ("AM", "PM")):
+        return None
+    hh, _, mm = partes[0].partition(":")
+    if not (hh.isdigit() and mm.isdigit() and len(mm) == 2):
+        return None
+    h, m = int(hh), int(mm)
+    if len(partes) == 2:
+        if not 1 <= h <= 12:
+            return None
+        h = h % 12 + (12 if partes[1] == "PM" else 0)
+    if h > 23 or m > 59:
+        return None
+    return h * 60 + m
+
 
 # --------------------------
 # Nodo de la lista
 # --------------------------
 class NodoPagina:
+    # Sin __dict__ por nodo: en sesiones largas hay millones de nodos
+    __slots__ = ("url", "titulo", "hora", "prev", "next", "orden", "marca",
+                 "prev_url", "next_url", "prev_titulo", "next_titulo")
+
     def __init__(self, url: str, titulo: str, hora: str):
-        self.url = url
+        # URL y hora se repiten mucho: se internan para compartir una sola copia
+        self.url = sys.intern(url)
         self.titulo = titulo
-        self.hora = hora
+        self.hora = sys.intern(hora)
         self.prev: Optional["NodoPagina"] = None
         self.next: Optional["NodoPagina"] = None
+        # Posición de llegada (crece siempre: el orden de la lista)
+        self.orden = 0
+        # Hora de visita en minutos desde el primer día (la asigna el historial)
+        self.marca = 0
+        # Cadenas de nodos con la misma URL / el mismo título, en orden de llegada
+        self.prev_url: Optional["NodoPagina"] = None
+        self.next_url: Optional["NodoPagina"] = None
+        self.prev_titulo: Optional["NodoPagina"] = None
+        self.next_titulo: Optional["NodoPagina"] = None
 
     def __repr__(self):
         return f"({self.url}, '{self.titulo}', {self.hora})"
 
+    def bytes_aproximados(self) -> int:
+        """Memoria del nodo y su título (URL y hora se comparten: las cuenta el historial)."""
+        return sys.getsizeof(self) + sys.getsizeof(self.titulo)
+
 # --------------------------
 # Lista Doblemente Enlazada
 # --------------------------
 class HistorialNavegacion:
-    def __init__(self):
+    """
+    Además de la lista, mantiene dos índices: URL -> nodos y título -> nodos.
+    Cada índice guarda el primer y el último nodo de una cadena doblemente
+    enlazada que pasa por los propios nodos (prev_url/next_url y
+    prev_titulo/next_titulo), así agregar, borrar y buscar son O(1) aunque
+    haya URLs o títulos repetidos.
+
+    Modo acotado: con max_paginas y/o max_bytes, al agregar una página se
+    desalojan las más antiguas desde head hasta volver al límite; nunca se
+    desaloja la página actual. bytes_usados suma los nodos, sus títulos y
+    una sola vez cada URL/hora internada distinta (con un conteo de usos
+    por texto); no incluye los índices (por_url, por_titulo, tiempo ni
+    IndiceBusqueda).
+
+    Con busqueda=True también mantiene un IndiceBusqueda (trie + n-gramas)
+    para buscar_prefijo y buscar_subcadena.
+
+    Índice de tiempo: la hora de cada página se convierte una sola vez en una
+    marca (minutos desde la medianoche del primer día; si la hora retrocede
+    se asume que pasó la medianoche). Como las páginas llegan en orden, las
+    marcas quedan ordenadas en un arreglo y se buscan con bisect. Las
+    páginas borradas solo se marcan como None y el índice se compacta cuando
+    la mitad de sus entradas están borradas; para saltar los borrados sin
+    recorrerlos uno por uno, _vivo_anterior lleva a la posición viva previa
+    (union-find con compresión de caminos).
+    """
+
+    def __init__(self, max_paginas: Optional[int] = None, max_bytes: Optional[int] = None,
+                 busqueda: bool = False):
         self.head: Optional[NodoPagina] = None
         self.tail: Optional[NodoPagina] = None
         self.current: Optional[NodoPagina] = None  # puntero a página actual
+        self.por_url: Dict[str, List[NodoPagina]] = {}  # url -> [primero, último]
+        self.por_titulo: Dict[str, List[NodoPagina]] = {}  # título -> [primero, último]
+        self._contador = 0
+        self.cantidad = 0
+        self.max_paginas = max_paginas
+        self.max_bytes = max_bytes
+        self.bytes_usados = 0
+        self._usos_compartidos: Dict[str, int] = {}  # URL/hora internada -> nodos que la usan
+        self.desalojadas = 0
+        self.bytes_desalojados = 0
+        self.busqueda: Optional[IndiceBusqueda] = IndiceBusqueda() if busqueda else None
+        # Índice de tiempo: marcas, orden de llegada y nodos en paralelo
+        self._marcas = array("q")
+        self._ordenes = array("q")
+        self._por_tiempo: List[Optional[NodoPagina]] = []
+        # Por posición: ella misma si está viva, o hacia atrás (compresión de caminos)
+        self._vivo_anterior = array("q")
+        self._borradas_tiempo = 0
+        self._ultima_marca = 0  # base para detectar el paso de medianoche
+
+    # --------------------------
+    # Índices URL / título
+    # --------------------------
+    def _contar_bytes(self, nodo: NodoPagina, signo: int) -> None:
+        """Suma (+1) o resta (-1) la memoria del nodo; cada texto compartido cuenta una vez."""
+        total = nodo.bytes_aproximados()
+        for texto in (nodo.url, nodo.hora):
+            usos = self._usos_compartidos.get(texto, 0) + signo
+            if usos == 0:
+                del self._usos_compartidos[texto]
+            else:
+                self._usos_compartidos[texto] = usos
+            if usos == 0 or (signo > 0 and usos == 1):  # último en salir o primer uso
+                total += sys.getsizeof(texto)
+        self.bytes_usados += signo * total
+
+    def _indexar(self, nodo: NodoPagina) -> None:
+        self._contar_bytes(nodo, +1)
+        extremos = self.por_url.get(nodo.url)
+        if extremos is None:
+            self.por_url[nodo.url] = [nodo, nodo]
+        else:
+            extremos[1].next_url = nodo
+            nodo.prev_url = extremos[1]
+            extremos[1] = nodo
+
+        extremos = self.por_titulo.get(nodo.titulo)
+        if extremos is None:
+            self.por_titulo[nodo.titulo] = [nodo, nodo]
+        else:
+            extremos[1].next_titulo = nodo
+            nodo.prev_titulo = extremos[1]
+            extremos[1] = nodo
+
+        if self.busqueda is not None:
+            self.busqueda.agregar(nodo)
+
+        self._marcas.append(nodo.marca)
+        self._ordenes.append(nodo.orden)
+        self._vivo_anterior.append(len(self._por_tiempo))
+        self._por_tiempo.append(nodo)
+
+    def _asignar_marca(self, nodo: NodoPagina) -> None:
+        """Marca de la página nueva a partir de la última asignada (no depende de borrados)."""
+        # Las horas no reconocidas heredan la marca anterior
+        anterior = self._ultima_marca
+        minutos = hora_a_minutos(nodo.hora)
+        marca = anterior if minutos is None else anterior - anterior % MINUTOS_DIA + minutos
+        if marca < anterior:  # pasó la medianoche
+            marca += MINUTOS_DIA
+        nodo.marca = self._ultima_marca = marca
+
+    def _desindexar(self, nodo: NodoPagina) -> None:
+        self._contar_bytes(nodo, -1)
+        extremos = self.por_url[nodo.url]
+        if nodo.prev_url:
+            nodo.prev_url.next_url = nodo.next_url
+        else:
+            extremos[0] = nodo.next_url
+        if nodo.next_url:
+            nodo.next_url.prev_url = nodo.prev_url
+        else:
+            extremos[1] = nodo.prev_url
+        if extremos[0] is None:
+            del self.por_url[nodo.url]
+        nodo.prev_url = nodo.next_url = None
+
+        extremos = self.por_titulo[nodo.titulo]
+        if nodo.prev_titulo:
+            nodo.prev_titulo.next_titulo = nodo.next_titulo
+        else:
+            extremos[0] = nodo.next_titulo
+        if nodo.next_titulo:
+            nodo.next_titulo.prev_titulo = nodo.prev_titulo
+        else:
+            extremos[1] = nodo.prev_titulo
+        if extremos[0] is None:
+            del self.por_titulo[nodo.titulo]
+        nodo.prev_titulo = nodo.next_titulo = None
+
+        if self.busqueda is not None:
+            self.busqueda.eliminar(nodo)
+
+        posicion = bisect_left(self._ordenes, nodo.orden)
+        self._por_tiempo[posicion] = None
+        self._vivo_anterior[posicion] = posicion - 1
+        self._borradas_tiempo += 1
+        if 2 * self._borradas_tiempo > len(self._por_tiempo):
+            self._compactar_tiempo()
+
+    def _compactar_tiempo(self) -> None:
+        vivos = [nodo for nodo in self._por_tiempo if nodo is not None]
+        self._marcas = array("q", (nodo.marca for nodo in vivos))
+        self._ordenes = array("q", (nodo.orden for nodo in vivos))
+        self._por_tiempo = vivos
+        self._vivo_anterior = array("q", range(len(vivos)))
+        self._borradas_tiempo = 0
+
+    def _ultimo_vivo(self, i: int) -> int:
+        """Última posición viva <= i en el índice de tiempo (-1 si no hay), estilo union-find."""
+        anteriores = self._vivo_anterior
+        raiz = i
+        while raiz >= 0 and anteriores[raiz] != raiz:
+            raiz = anteriores[raiz]
+        while i != raiz:  # compresión de caminos: todo el tramo apunta a la raíz
+            siguiente = anteriores[i]
+            anteriores[i] = raiz
+            i = siguiente
+        return raiz
+
+    def _desenlazar(self, nodo: NodoPagina) -> None:
+        """Saca un nodo de la lista y de los índices."""
+        if nodo.prev:
+            nodo.prev.next = nodo.next
+        else:
+            self.head = nodo.next
+        if nodo.next:
+            nodo.next.prev = nodo.prev
+        else:
+            self.tail = nodo.prev
+        # si borramos la actual, mover current
+        if self.current is nodo:
+            self.current = nodo.prev or nodo.next
+        nodo.prev = nodo.next = None
+        self._desindexar(nodo)
+        self.cantidad -= 1
+
+    def _excede_limite(self) -> bool:
+        return ((self.max_paginas is not None and self.cantidad > self.max_paginas)
+                or (self.max_bytes is not None and self.bytes_usados > self.max_bytes))
+
+    def _desalojar(self) -> None:
+        """Saca páginas desde head mientras se supere algún límite."""
+        while self._excede_limite() and self.head is not None and self.head is not self.current:
+            antes = self.bytes_usados
+            self._desenlazar(self.head)
+            self.bytes_desalojados += antes - self.bytes_usados
+            self.desalojadas += 1
+
+    def estadisticas(self) -> Dict[str, Optional[int]]:
+        """Páginas y memoria aproximada en uso (sin índices), y lo desalojado hasta ahora."""
+        return {
+            "paginas": self.cantidad,
+            "bytes": self.bytes_usados,
+            "max_paginas": self.max_paginas,
+            "max_bytes": self.max_bytes,
+            "desalojadas": self.desalojadas,
+            "bytes_desalojados": self.bytes_desalojados,
+        }
 
     # a) Agregar nueva página al final
     def agregar_pagina(self, url: str, titulo: str, hora: str) -> None:
         nuevo = NodoPagina(url, titulo, hora)
+        nuevo.orden = self._contador
+        self._contador += 1
         if self.head is None:  # lista vacía
             self.head = self.tail = nuevo
         else:
             self.tail.next = nuevo
             nuevo.prev = self.tail
             self.tail = nuevo
+        self._asignar_marca(nuevo)
+        self._indexar(nuevo)
+        self.cantidad += 1
         self.current = nuevo  # mover al final como "página actual"
+        self._desalojar()
 
     # b) Retroceder en el historial
     def retroceder(self) -> Optional[NodoPagina]:
@@ -61,49 +314,127 @@ class HistorialNavegacion:
             return self.current
         return None
 
-    # d) Eliminar una página por su URL
+    # d) Eliminar una página por su URL (la primera desde el inicio), O(1)
     def eliminar_pagina(self, url: str) -> bool:
-        actual = self.head
-        while actual:
-            if actual.url == url:
-                # caso 1: es la cabeza
-                if actual == self.head:
-                    self.head = actual.next
-                    if self.head:
-                        self.head.prev = None
-                # caso 2: es la cola
-                elif actual == self.tail:
-                    self.tail = actual.prev
-                    if self.tail:
-                        self.tail.next = None
-                else:
-                    actual.prev.next = actual.next
-                    actual.next.prev = actual.prev
-                # si borramos la actual, mover current
-                if self.current == actual:
-                    self.current = actual.prev or actual.next
-                return True
-            actual = actual.next
-        return False
+        extremos = self.por_url.get(url)
+        if extremos is None:
+            return False
+        self._desenlazar(extremos[0])
+        return True
 
-    # e) Buscar página por URL o título
+    # e) Buscar página por URL o título (la primera desde el inicio), O(1)
     def buscar(self, clave: str) -> Optional[NodoPagina]:
-        actual = self.head
-        while actual:
-            if actual.url == clave or actual.titulo == clave:
-                return actual
-            actual = actual.next
-        return None
+        por_url = self.por_url.get(clave)
+        por_titulo = self.por_titulo.get(clave)
+        if por_url is None:
+            return por_titulo[0] if por_titulo else None
+        if por_titulo is None or por_url[0].orden < por_titulo[0].orden:
+            return por_url[0]
+        return por_titulo[0]
+
+    # Búsqueda parcial (requiere busqueda=True)
+    def _indice_busqueda(self) -> IndiceBusqueda:
+        if self.busqueda is None:
+            raise ValueError("La búsqueda parcial está desactivada: crea el historial con busqueda=True")
+        return self.busqueda
+
+    def buscar_prefijo(self, consulta: str, k: int = 10, recientes: bool = True) -> List[NodoPagina]:
+        """Hasta k páginas cuya URL o alguna palabra del título empieza con la consulta."""
+        return self._indice_busqueda().buscar_prefijo(consulta, k, recientes)
+
+    def buscar_subcadena(self, consulta: str, k: int = 10, recientes: bool = True) -> List[NodoPagina]:
+        """Hasta k páginas cuya URL o título contiene la consulta."""
+        return self._indice_busqueda().buscar_subcadena(consulta, k, recientes)
+
+    # g) Consultas por hora, O(log n) + resultado
+    def _marca(self, hora: Union[str, int]) -> int:
+        """Una marca numérica se usa tal cual; un texto se toma como hora del primer día."""
+        if isinstance(hora, int):
+            return hora
+        minutos = hora_a_minutos(hora)
+        if minutos is None:
+            raise ValueError(f"Hora no reconocida: {hora!r}")
+        return minutos
+
+    def paginas_entre(self, desde: Union[str, int], hasta: Union[str, int]) -> List[NodoPagina]:
+        """Páginas visitadas entre 'desde' y 'hasta' (incluidas), en orden de historial."""
+        inicio = bisect_left(self._marcas, self._marca(desde))
+        fin = bisect_right(self._marcas, self._marca(hasta))
+        return [nodo for nodo in self._por_tiempo[inicio:fin] if nodo is not None]
+
+    def ir_a_hora(self, hora: Union[str, int]) -> Optional[NodoPagina]:
+        """
+        Mueve la página actual a la última visitada hasta esa hora y la devuelve.
+        Si no hay ninguna tan temprana, no cambia nada y devuelve None.
+        """
+        i = self._ultimo_vivo(bisect_right(self._marcas, self._marca(hora)) - 1)
+        if i < 0:
+            return None
+        self.current = self._por_tiempo[i]
+        return self.current
 
     # f) Mostrar historial completo
-    def mostrar_historial(self) -> None:
-        actual = self.head
-        historial = []
+    def entradas(self, desde: Optional[NodoPagina] = None, hasta: Optional[NodoPagina] = None) -> Iterator[str]:
+        """Genera cada página ya formateada, de 'desde' (head) hasta 'hasta' (tail) incluidas."""
+        actual = desde or self.head
         while actual:
-            marcador = " <= [Actual]" if actual == self.current else ""
-            historial.append(f"{actual}{marcador}")
+            marcador = " <= [Actual]" if actual is self.current else ""
+            yield f"{actual}{marcador}"
+            if actual is hasta:
+                break
             actual = actual.next
-        print(" ←→ ".join(historial))
+
+    def exportar(self, archivo: TextIO, separador: str = "\n", tamano_bloque: int = 1000) -> int:
+        """
+        Escribe el historial en un objeto tipo archivo de a bloques de 'tamano_bloque'
+        páginas, sin armar el texto completo en memoria. Devuelve cuántas escribió.
+        """
+        total = 0
+        bloque: List[str] = []
+        for entrada in self.entradas():
+            if total:
+                bloque.append(separador)
+            bloque.append(entrada)
+            total += 1
+            if len(bloque) >= 2 * tamano_bloque:
+                archivo.write("".join(bloque))
+                bloque.clear()
+        archivo.write("".join(bloque))
+        return total
+
+    def mostrar_historial(self) -> None:
+        self.exportar(sys.stdout, separador=" ←→ ")
+        print()
+
+    def ventana(self, n: int = 5) -> List[NodoPagina]:
+        """Hasta n páginas antes de la actual, la actual y hasta n después."""
+        if self.current is None:
+            return []
+        inicio = fin = self.current
+        for _ in range(n):
+            if inicio.prev is None:
+                break
+            inicio = inicio.prev
+        for _ in range(n):
+            if fin.next is None:
+                break
+            fin = fin.next
+        paginas = [inicio]
+        while paginas[-1] is not fin:
+            paginas.append(paginas[-1].next)
+        return paginas
+
+    def mostrar_ventana(self, n: int = 5) -> None:
+        """Muestra solo la ventana alrededor de la página actual ("…" si hay más)."""
+        paginas = self.ventana(n)
+        if not paginas:
+            print()
+            return
+        partes = ["…"] if paginas[0].prev else []
+        partes.extend(self.entradas(paginas[0], paginas[-1]))
+        if paginas[-1].next:
+            partes.append("…")
+        print(" ←→ ".join(partes))
 
 
 # --------------------------
@@ -146,3 +477,30 @@ if __name__ == "__main__":
     historial.agregar_pagina("openai.com", "OpenAI", "10:20 AM")
     historial.mostrar_historial()
 
+    # Historial acotado
+    print("\nHistorial acotado a 3 páginas:")
+    acotado = HistorialNavegacion(max_paginas=3)
+    for url, titulo, hora in [("google.com", "Google", "10:00 AM"), ("wikipedia.org", "Wikipedia", "10:05 AM"),
+                              ("github.com", "GitHub", "10:10 AM"), ("openai.com", "OpenAI", "10:20 AM")]:
+        acotado.agregar_pagina(url, titulo, hora)
+    acotado.mostrar_historial()
+    print("Estadísticas:", acotado.estadisticas())
+
+    # Búsqueda por prefijo y subcadena
+    print("\nBúsqueda parcial:")
+    buscable = HistorialNavegacion(busqueda=True)
+    for url, titulo, hora in [("github.com", "GitHub", "10:10 AM"), ("stackoverflow.com", "Stack Overflow", "10:15 AM"),
+                              ("gitlab.com", "GitLab", "10:25 AM")]:
+        buscable.agregar_pagina(url, titulo, hora)
+    print("Prefijo 'git':", buscable.buscar_prefijo("git"))
+    print("Subcadena 'overfl':", buscable.buscar_subcadena("overfl"))
+
+    # Vista parcial alrededor de la página actual
+    print("\nVentana de 1 página alrededor de la actual:")
+    historial.retroceder()
+    historial.mostrar_ventana(1)
+
+    # Consultas por hora
+    print("\nPáginas entre 10:00 AM y 10:10 AM:", historial.paginas_entre("10:00 AM", "10:10 AM"))
+    print("Ir a las 10:07 AM:", historial.ir_a_hora("10:07 AM"))
+    historial.mostrar_historial()
@@ -1,17 +1,28 @@
 class Node:
+  # Sin __dict__ por instancia: cada nodo ocupa solo sus dos referencias
+  __slots__ = ("value", "next")
+
   def __init__(self, value):
     self.value = value
     self.next = None
 
 class Stack:
-  def __init__(self):
+  # Con reciclar=True los nodos que salen con pop se guardan en una lista
+  # libre (enlazada por 'next') y push los reutiliza en vez de crear nuevos
+  def __init__(self, reciclar=False):
     self.head = None
     self.size = 0
+    self.reciclar = reciclar
+    self._libres = None
 
   def push(self, value):
-    new_node = Node(value)
-    if self.head:
-      new_node.next = self.head
+    if self._libres:
+      new_node = self._libres
+      self._libres = new_node.next
+      new_node.value = value
+    else:
+      new_node = Node(value)
+    new_node.next = self.head
     self.head = new_node
     self.size += 1
 
@@ -21,7 +32,12 @@ class Stack:
     popped_node = self.head
     self.head = self.head.next
     self.size -= 1
-    return popped_node.value
+    value = popped_node.value
+    if self.reciclar:
+      popped_node.value = None
+      popped_node.next = self._libres
+      self._libres = popped_node
+    return value
 
   def peek(self):
     if self.isEmpty():
@@ -34,6 +50,19 @@ class Stack:
   def stackSize(self):
     return self.size
 
+  def snapshot(self):
+    # O(1): la versión comparte los nodos actuales. push nunca modifica un
+    # nodo existente, pero el reciclaje sí, así que tomar una instantánea
+    # lo desactiva para no alterar versiones guardadas.
+    self.reciclar = False
+    self._libres = None
+    return PersistentStack(self.head, self.size)
+
+  def restore(self, version):
+    # O(1): vuelve a una versión tomada con snapshot() (deshacer)
+    self.head = version.head
+    self.size = version.size
+
   def traverseAndPrint(self):
     currentNode = self.head
     while currentNode:
@@ -41,16 +70,195 @@ class Stack:
       currentNode = currentNode.next
     print()
 
-myStack = Stack()
-myStack.push('A')
-myStack.push('B')
-myStack.push('C')
-
-print("LinkedList: ", end="")
-myStack.traverseAndPrint()
-print("Peek: ", myStack.peek())
-print("Pop: ", myStack.pop())
-print("LinkedList after Pop: ", end="")
-myStack.traverseAndPrint()
-print("isEmpty: ", myStack.isEmpty())
-print("Size: ", myStack.stackSize())
\ No newline at end of file
+class PersistentStack:
+  # Pila inmutable: push y pop devuelven una versión nueva que comparte los
+  # nodos con la anterior, así que cada versión guardada cuesta solo los
+  # nodos que agregó. Los nodos nunca se modifican una vez enlazados.
+  __slots__ = ("head", "size")
+
+  def __init__(self, head=None, size=0):
+    self.head = head
+    self.size = size
+
+  def push(self, value):
+    new_node = Node(value)
+    new_node.next = self.head
+    return PersistentStack(new_node, self.size + 1)
+
+  def pop(self):
+    # Devuelve la versión sin el tope; el valor se lee antes con peek()
+    if self.isEmpty():
+      return "Stack is empty"
+    return PersistentStack(self.head.next, self.size - 1)
+
+  def peek(self):
+    if self.isEmpty():
+      return "Stack is empty"
+    return self.head.value
+
+  def isEmpty(self):
+    return self.size == 0
+
+  def stackSize(self):
+    return self.size
+
+  def snapshot(self):
+    return self
+
+  def __iter__(self):
+    currentNode = self.head
+    while currentNode:
+      yield currentNode.value
+      currentNode = currentNode.next
+
+  def traverseAndPrint(self):
+    for value in self:
+      print(value, end=" -> ")
+    print()
+
+class BlockNode:
+  # Nodo de la pila desenrollada: guarda hasta 'tamano_bloque' valores
+  __slots__ = ("values", "next")
+
+  def __init__(self, next=None):
+    self.values = []
+    self.next = next
+
+class UnrolledStack:
+  # Pila enlazada por bloques: cada nodo guarda un bloque de valores (el
+  # tope es el último del bloque de 'head'), así se paga un nodo cada
+  # 'tamano_bloque' elementos. push/pop siguen siendo O(1) amortizado; un
+  # bloque vacío se guarda como repuesto para no crear/destruir bloques al
+  # alternar push y pop en el borde.
+  def __init__(self, tamano_bloque=64):
+    # Con bloques de 0 elementos push_many nunca avanzaría
+    if tamano_bloque < 1:
+      raise ValueError("tamano_bloque debe ser al menos 1")
+    self.head = None
+    self.size = 0
+    self.tamano_bloque = tamano_bloque
+    self._repuesto = None
+
+  def _nuevo_bloque(self):
+    bloque = self._repuesto or BlockNode()
+    self._repuesto = None
+    bloque.next = self.head
+    self.head = bloque
+    return bloque
+
+  def _soltar_bloque(self):
+    bloque = self.head
+    self.head = bloque.next
+    bloque.next = None
+    self._repuesto = bloque
+
+  def push(self, value):
+    if self.head is None or len(self.head.values) == self.tamano_bloque:
+      self._nuevo_bloque()
+    self.head.values.append(value)
+    self.size += 1
+
+  def push_many(self, values):
+    values = list(values)
+    i = 0
+    while i < len(values):
+      if self.head is None or len(self.head.values) == self.tamano_bloque:
+        self._nuevo_bloque()
+      libre = self.tamano_bloque - len(self.head.values)
+      self.head.values.extend(values[i:i + libre])
+      i += libre
+    self.size += len(values)
+
+  def pop(self):
+    if self.isEmpty():
+      return "Stack is empty"
+    value = self.head.values.pop()
+    self.size -= 1
+    if not self.head.values:
+      self._soltar_bloque()
+    return value
+
+  def pop_many(self, n):
+    # Devuelve hasta n valores en orden de salida (el tope primero)
+    result = []
+    while n > 0 and self.head is not None:
+      values = self.head.values
+      k = min(n, len(values))
+      result.extend(reversed(values[len(values) - k:]))
+      del values[len(values) - k:]
+      self.size -= k
+      n -= k
+      if not values:
+        self._soltar_bloque()
+    return result
+
+  def peek(self):
+    if self.isEmpty():
+      return "Stack is empty"
+    return self.head.values[-1]
+
+  def isEmpty(self):
+    return self.size == 0
+
+  def stackSize(self):
+    return self.size
+
+  def __iter__(self):
+    # Del tope hacia el fondo, igual que traverseAndPrint
+    block = self.head
+    while block:
+      yield from reversed(block.values)
+      block = block.next
+
+  def traverseAndPrint(self):
+    for value in self:
+      print(value, end=" -> ")
+    print()
+
+if __name__ == "__main__":
+  myStack = Stack()
+  myStack.push('A')
+  myStack.push('B')
+  myStack.push('C')
+
+  print("LinkedList: ", end="")
+  myStack.traverseAndPrint()
+  print("Peek: ", myStack.peek())
+  print("Pop: ", myStack.pop())
+  print("LinkedList after Pop: ", end="")
+  myStack.traverseAndPrint()
+  print("isEmpty: ", myStack.isEmpty())
+  print("Size: ", myStack.stackSize())
+
+  myPool = Stack(reciclar=True)
+  for letter in 'ABC':
+    myPool.push(letter)
+  myPool.pop()
+  myPool.push('D')  # reutiliza el nodo de 'C'
+  print("LinkedList with pool: ", end="")
+  myPool.traverseAndPrint()
+
+  myUnrolled = UnrolledStack(tamano_bloque=2)
+  myUnrolled.push_many(['A', 'B', 'C', 'D', 'E'])
+  print("Unrolled: ", end="")
+  myUnrolled.traverseAndPrint()
+  print("Pop many: ", myUnrolled.pop_many(3))
+  print("Peek: ", myUnrolled.peek())
+  print("Size: ", myUnrolled.stackSize())
+
+  version1 = PersistentStack().push('A').push('B')
+  version2 = version1.push('C')
+  version3 = version2.pop()
+  print("Persistent v1: ", end="")
+  version1.traverseAndPrint()
+  print("Persistent v2: ", end="")
+  version2.traverseAndPrint()
+  print("Persistent v3 shares v1 nodes: ", version3.head is version1.head)
+
+  myEditor = Stack()
+  myEditor.push('x')
+  undo = myEditor.snapshot()
+  myEditor.push('y')
+  myEditor.restore(undo)
+  print("After undo: ", end="")
+  myEditor.traverseAndPrint()
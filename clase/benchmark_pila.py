@@ -0,0 +1,60 @@
+"""
+Benchmark de memoria y throughput para las pilas.
+
+Compara el Stack de pila6.py (lista de Python) con el Stack enlazado de
+Pila_Enlasada.py con nodos slotted (con y sin reciclaje de nodos) y con
+la variante desenrollada UnrolledStack (un nodo por bloque de valores).
+- Memoria: pico de tracemalloc al apilar N elementos (bytes por elemento).
+- Throughput: ráfagas de RAFAGA push seguidas de RAFAGA pop, repetidas
+  hasta sumar OPERACIONES operaciones.
+
+Uso:  python benchmark_pila.py
+"""
+
+import gc
+import time
+import tracemalloc
+
+import pila6
+import Pila_Enlasada
+
+N = 1_000_000
+OPERACIONES = 2_000_000
+RAFAGA = 1000
+
+PILAS = [
+  ("lista (pila6)", pila6.Stack),
+  ("enlazada", Pila_Enlasada.Stack),
+  ("enlazada + reciclar", lambda: Pila_Enlasada.Stack(reciclar=True)),
+  ("desenrollada (64)", Pila_Enlasada.UnrolledStack),
+]
+
+
+def memoria_por_elemento(crear):
+  gc.collect()
+  tracemalloc.start()
+  pila = crear()
+  for i in range(N):
+    pila.push(i)
+  _, pico = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return pico / N
+
+
+def throughput(crear):
+  pila = crear()
+  rondas = OPERACIONES // (2 * RAFAGA)
+  inicio = time.perf_counter()
+  for _ in range(rondas):
+    for i in range(RAFAGA):
+      pila.push(i)
+    for _ in range(RAFAGA):
+      pila.pop()
+  return rondas * 2 * RAFAGA / (time.perf_counter() - inicio)
+
+
+if __name__ == "__main__":
+  print(f"{'pila':<22} | {'bytes/elemento':>14} | {'ops/s':>12}")
+  print("-" * 54)
+  for nombre, crear in PILAS:
+    print(f"{nombre:<22} | {memoria_por_elemento(crear):>14.1f} | {throughput(crear):>12,.0f}")
@@ -1,3 +1,5 @@
+from pila6 import IndexedStack
+
 pilaFia = []
 pilaFia2 = []
 
@@ -31,4 +33,13 @@ print("Elementos guardados temporalmente:", pilaFia2)
 while pilaFia2:
     pilaFia.append(pilaFia2.pop())
 
-print("Pila restaurada (sin el número eliminado):", pilaFia)
\ No newline at end of file
+print("Pila restaurada (sin el número eliminado):", pilaFia)
+
+# Lo mismo con IndexedStack: borra el número sin vaciar la pila en una auxiliar
+pilaIndexada = IndexedStack()
+for numero in [1, 2, 3, 4, 5, 6, 7]:
+    pilaIndexada.push(numero)
+
+if pilaIndexada.remove_value(sacarD):
+    print(f"¡Número {sacarD} eliminado con IndexedStack!")
+print("IndexedStack sin el número eliminado:", list(pilaIndexada))
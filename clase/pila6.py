@@ -21,16 +21,121 @@ class Stack:
   def size(self):
     return len(self.stack)
 
-# Create a stack
-myStack = Stack()
-
-myStack.push('A')
-myStack.push('B')
-myStack.push('C')
-
-print("Stack: ", myStack.stack)
-print("Pop: ", myStack.pop())
-print("Stack after Pop: ", myStack.stack)
-print("Peek: ", myStack.peek())
-print("isEmpty: ", myStack.isEmpty())
-print("Size: ", myStack.size())
\ No newline at end of file
+# Marca de un valor borrado que todavía ocupa su posición en self.stack
+_DELETED = object()
+
+class IndexedStack(Stack):
+  # Pila LIFO que además permite borrar por valor sin desapilar todo en una
+  # pila auxiliar. Un índice valor -> posiciones vivas da membership en O(1);
+  # remove_value deja una marca (_DELETED) en la posición y las marcas se
+  # limpian al llegar al tope o, si superan la mitad de la lista, de una vez.
+  # Los valores deben ser hashables.
+  def __init__(self):
+    super().__init__()
+    self._positions = {}
+    self._live = 0
+
+  def push(self, element):
+    self._positions.setdefault(element, []).append(len(self.stack))
+    self.stack.append(element)
+    self._live += 1
+
+  def _trim_top(self):
+    while self.stack and self.stack[-1] is _DELETED:
+      self.stack.pop()
+
+  def _compact(self):
+    self.stack = [e for e in self.stack if e is not _DELETED]
+    self._positions = {}
+    for i, element in enumerate(self.stack):
+      self._positions.setdefault(element, []).append(i)
+
+  def pop(self):
+    if self.isEmpty():
+      return "Stack is empty"
+    element = self.stack.pop()
+    self._forget_last(element)
+    self._trim_top()
+    if len(self.stack) > 2 * self._live:
+      self._compact()
+    return element
+
+  def peek(self):
+    if self.isEmpty():
+      return "Stack is empty"
+    return self.stack[-1]
+
+  def _forget_last(self, element):
+    positions = self._positions[element]
+    positions.pop()
+    if not positions:
+      del self._positions[element]
+    self._live -= 1
+
+  def remove_value(self, element):
+    # Borra la aparición más cercana al tope, como el borrado LIFO con pila
+    # auxiliar. Devuelve False si el valor no está.
+    positions = self._positions.get(element)
+    if not positions:
+      return False
+    self.stack[positions[-1]] = _DELETED
+    self._forget_last(element)
+    self._trim_top()
+    if len(self.stack) > 2 * self._live:
+      self._compact()
+    return True
+
+  def remove_all(self, elements):
+    # Borra todas las apariciones de cada valor; devuelve cuántos se borraron
+    removed = 0
+    for element in set(elements):
+      positions = self._positions.pop(element, None)
+      if not positions:
+        continue
+      for i in positions:
+        self.stack[i] = _DELETED
+      removed += len(positions)
+    self._live -= removed
+    self._trim_top()
+    if len(self.stack) > 2 * self._live:
+      self._compact()
+    return removed
+
+  def __contains__(self, element):
+    return element in self._positions
+
+  def __iter__(self):
+    # Del fondo al tope, sin las marcas de borrado
+    return (e for e in self.stack if e is not _DELETED)
+
+  def isEmpty(self):
+    return self._live == 0
+
+  def size(self):
+    return self._live
+
+if __name__ == "__main__":
+  # Create a stack
+  myStack = Stack()
+
+  myStack.push('A')
+  myStack.push('B')
+  myStack.push('C')
+
+  print("Stack: ", myStack.stack)
+  print("Pop: ", myStack.pop())
+  print("Stack after Pop: ", myStack.stack)
+  print("Peek: ", myStack.peek())
+  print("isEmpty: ", myStack.isEmpty())
+  print("Size: ", myStack.size())
+
+  myIndexed = IndexedStack()
+  for n in [1, 2, 3, 4, 5, 6, 7]:
+    myIndexed.push(n)
+  print("\nIndexedStack: ", list(myIndexed))
+  print("remove_value(5): ", myIndexed.remove_value(5))
+  print("5 in stack: ", 5 in myIndexed)
+  print("remove_all([2, 7]): ", myIndexed.remove_all([2, 7]))
+  print("Stack: ", list(myIndexed))
+  print("Pop: ", myIndexed.pop())
+  print("Size: ", myIndexed.size())
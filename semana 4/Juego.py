@@ -1,61 +1,155 @@
+"""
+Juego de rebote con pygame.
+
+Dos modos de dibujo:
+- "sucio" (por defecto): el fondo (color + imagen) se compone una sola vez;
+  en cada frame solo se repintan y se envían a pantalla los rectángulos
+  que ocupan o ocupaban la pelota y el bate (display.update con esa lista).
+- "completo": el dibujo original, fill + fondo + sprites y display.flip().
+En ambos las imágenes se convierten al formato de la pantalla al cargarlas
+y se usa un único reloj, así tick(60) sí limita a 60 fps.
+
+Uso:  python Juego.py [--completo]
+"""
+
+import sys
+from time import perf_counter
+
 import pygame
-pygame.init()
-
-# Crea la ventana
-ventana = pygame.display.set_mode((640,480))
-pygame.display.set_caption("Juego de rebote")
-
-# Cargar imagen como ícono
-icono = pygame.image.load("icon.png")
-pygame.display.set_icon(icono)
-
-# Cargar imagen de fondo
-fondo = pygame.image.load("fondo.png")  # Asegúrate de que esta imagen tenga el tamaño adecuado
-
-
-#carga la imagen de la pelota y obtengo su rectángulo
-ball = pygame.image.load("pelota.png")
-ballrect = ball.get_rect()
-speed = [4,4]
-ballrect.move_ip(0,0)
-
-# Crea el objeto bate, y obtengo su rectángulo
-bate = pygame.image.load("FIA.png")
-baterect = bate.get_rect()
-
-
-# Pongo el bate en la parte inferior de la pantalla
-baterect.move_ip(240,450)
-jugando = True
-while jugando:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            jugando = False
-
-    # Compruebo si se ha pulsado alguna tecla
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        baterect = baterect.move(-3,0)
-    if keys[pygame.K_RIGHT]:
-        baterect = baterect.move(3,0)
-    # Compruebo si hay colisión
-    if baterect.colliderect(ballrect):
-        speed[1] = -speed[1]
- 
-    ballrect = ballrect.move(speed)
-    if ballrect.left < 0 or ballrect.right > ventana.get_width():
-        speed[0] = -speed[0]
-    if ballrect.top < 0 or ballrect.bottom > ventana.get_height():
-        speed[1] = -speed[1]
-    ventana.fill((252, 243, 207))
-    # Dibujar fondo 
-    ventana.blit(fondo, (0, 0))
-    ventana.blit(ball, ballrect)
-
-    
-
-    # Dibujo el bate
-    ventana.blit(bate, baterect)
-    pygame.display.flip()
-    pygame.time.Clock().tick(60)
-pygame.quit()
\ No newline at end of file
+
+ANCHO, ALTO = 640, 480
+COLOR_FONDO = (252, 243, 207)
+FPS = 60
+
+
+def _no_marcar(instante):
+    pass
+
+
+def cargar_imagenes():
+    """Carga fondo, pelota y bate ya convertidos (requiere display.set_mode antes)."""
+    fondo = pygame.image.load("fondo.png").convert_alpha()  # Asegúrate de que esta imagen tenga el tamaño adecuado
+    ball = pygame.image.load("pelota.png").convert_alpha()
+    bate = pygame.image.load("FIA.png").convert_alpha()
+    return fondo, ball, bate
+
+
+class JuegoRebote:
+    def __init__(self, ventana, fondo, ball, bate, modo="sucio"):
+        if modo not in ("sucio", "completo"):
+            raise ValueError(f"Modo de dibujo desconocido: {modo!r}")
+        self.ventana = ventana
+        self.modo = modo
+        self.imagen_fondo = fondo
+        # Fondo final compuesto una vez, opaco y en el formato de la pantalla
+        self.fondo = pygame.Surface(ventana.get_size()).convert()
+        self.fondo.fill(COLOR_FONDO)
+        self.fondo.blit(fondo, (0, 0))
+
+        # La pelota y su rectángulo
+        self.ball = ball
+        self.ballrect = ball.get_rect()
+        self.speed = [4, 4]
+
+        # El bate, en la parte inferior de la pantalla
+        self.bate = bate
+        self.baterect = bate.get_rect()
+        self.baterect.move_ip(240, 450)
+
+        self.reloj = pygame.time.Clock()  # uno solo: tick() mide desde el frame anterior
+        self.jugando = True
+        self._fondo_dibujado = False
+
+    def entrada(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.jugando = False
+
+        # Compruebo si se ha pulsado alguna tecla
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT]:
+            self.baterect = self.baterect.move(-3, 0)
+        if keys[pygame.K_RIGHT]:
+            self.baterect = self.baterect.move(3, 0)
+
+    def fisica(self):
+        # Compruebo si hay colisión
+        if self.baterect.colliderect(self.ballrect):
+            self.speed[1] = -self.speed[1]
+
+        self.ballrect = self.ballrect.move(self.speed)
+        if self.ballrect.left < 0 or self.ballrect.right > self.ventana.get_width():
+            self.speed[0] = -self.speed[0]
+        if self.ballrect.top < 0 or self.ballrect.bottom > self.ventana.get_height():
+            self.speed[1] = -self.speed[1]
+
+    def dibujar_completo(self):
+        self.ventana.fill(COLOR_FONDO)
+        self.ventana.blit(self.imagen_fondo, (0, 0))
+        self.ventana.blit(self.ball, self.ballrect)
+        self.ventana.blit(self.bate, self.baterect)
+        pygame.display.flip()
+
+    def dibujar_sucio(self, ball_antes, bate_antes):
+        """Borra con el fondo donde estaban los sprites, los dibuja y actualiza solo esas zonas."""
+        if not self._fondo_dibujado:
+            self.ventana.blit(self.fondo, (0, 0))
+            self.ventana.blit(self.ball, self.ballrect)
+            self.ventana.blit(self.bate, self.baterect)
+            pygame.display.flip()
+            self._fondo_dibujado = True
+            return
+        pantalla = self.ventana.get_rect()
+        sucios = [ball_antes.union(self.ballrect).clip(pantalla),
+                  bate_antes.union(self.baterect).clip(pantalla)]
+        for rect in sucios:
+            self.ventana.blit(self.fondo, rect, rect)
+        self.ventana.blit(self.ball, self.ballrect)
+        self.ventana.blit(self.bate, self.baterect)
+        pygame.display.update(sucios)
+
+    def dibujar(self, ball_antes, bate_antes):
+        if self.modo == "sucio":
+            self.dibujar_sucio(ball_antes, bate_antes)
+        else:
+            self.dibujar_completo()
+
+    def frame(self, marcas=None):
+        """
+        Un paso del bucle: entrada, física y dibujo.
+        marcas: lista opcional a la que se agregan 4 instantes (perf_counter):
+        el inicio y el fin de cada fase, para medir el frame real por partes.
+        """
+        marcar = marcas.append if marcas is not None else _no_marcar
+        marcar(perf_counter())
+        ball_antes, bate_antes = self.ballrect, self.baterect
+        self.entrada()
+        marcar(perf_counter())
+        self.fisica()
+        marcar(perf_counter())
+        self.dibujar(ball_antes, bate_antes)
+        marcar(perf_counter())
+
+    def ejecutar(self, fps=FPS):
+        while self.jugando:
+            self.frame()
+            self.reloj.tick(fps)
+
+
+def main(modo="sucio"):
+    pygame.init()
+
+    # Crea la ventana
+    ventana = pygame.display.set_mode((ANCHO, ALTO))
+    pygame.display.set_caption("Juego de rebote")
+
+    # Cargar imagen como ícono
+    pygame.display.set_icon(pygame.image.load("icon.png"))
+
+    juego = JuegoRebote(ventana, *cargar_imagenes(), modo=modo)
+    juego.ejecutar()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main("completo" if "--completo" in sys.argv[1:] else "sucio")
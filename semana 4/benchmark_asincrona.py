@@ -0,0 +1,76 @@
+"""
+Benchmark asyncio: ColaAsincrona vs asyncio.Queue.
+
+Lanza miles de corutinas productoras y consumidoras sobre una misma cola
+acotada y mide el throughput total (elementos/s). Cada productora encola
+POR_PRODUCTOR elementos; al terminar, la cola se cierra (ColaAsincrona) o
+se envía un centinela por consumidora (asyncio.Queue).
+
+Uso:  python benchmark_asincrona.py
+"""
+
+import asyncio
+import time
+
+from cola_asincrona import ColaAsincrona
+
+POR_PRODUCTOR = 100
+CAPACIDAD = 1000
+CONFIGURACIONES = [(1000, 1000), (5000, 1000), (1000, 5000)]  # (productoras, consumidoras)
+
+
+async def con_cola_asincrona(productoras, consumidoras):
+  cola = ColaAsincrona(CAPACIDAD)
+  consumidos = [0]
+
+  async def producir():
+    for i in range(POR_PRODUCTOR):
+      await cola.enqueue(i)
+
+  async def consumir():
+    async for _ in cola:
+      consumidos[0] += 1
+
+  tareas_c = [asyncio.create_task(consumir()) for _ in range(consumidoras)]
+  await asyncio.gather(*(producir() for _ in range(productoras)))
+  cola.cerrar()
+  await asyncio.gather(*tareas_c)
+  return consumidos[0]
+
+
+async def con_asyncio_queue(productoras, consumidoras):
+  cola = asyncio.Queue(CAPACIDAD)
+  consumidos = [0]
+
+  async def producir():
+    for i in range(POR_PRODUCTOR):
+      await cola.put(i)
+
+  async def consumir():
+    while True:
+      if await cola.get() is None:
+        return
+      consumidos[0] += 1
+
+  tareas_c = [asyncio.create_task(consumir()) for _ in range(consumidoras)]
+  await asyncio.gather(*(producir() for _ in range(productoras)))
+  for _ in range(consumidoras):
+    await cola.put(None)
+  await asyncio.gather(*tareas_c)
+  return consumidos[0]
+
+
+def medir(corutina, productoras, consumidoras):
+  inicio = time.perf_counter()
+  total = asyncio.run(corutina(productoras, consumidoras))
+  return total / (time.perf_counter() - inicio)
+
+
+if __name__ == "__main__":
+  print(f"{'productoras/consumidoras':>24} | {'cola':<14} | {'elem/s':>10}")
+  print("-" * 56)
+  for productoras, consumidoras in CONFIGURACIONES:
+    for nombre, corutina in (("asyncio.Queue", con_asyncio_queue),
+                             ("ColaAsincrona", con_cola_asincrona)):
+      throughput = medir(corutina, productoras, consumidoras)
+      print(f"{f'{productoras}/{consumidoras}':>24} | {nombre:<14} | {throughput:>10,.0f}")
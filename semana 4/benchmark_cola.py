@@ -0,0 +1,46 @@
+"""
+Benchmark de throughput: ColaFia (lista) vs ColaDeque (collections.deque).
+
+Para cada tamaño n (10^3 .. 10^6) se llena la cola con n elementos y se
+mide un régimen estable de OPERACIONES pares dequeue + enqueue y
+enqueue_front + dequeue. Con la lista cada dequeue/enqueue_front desplaza
+los n elementos (O(n)); con la deque el costo por operación es constante.
+
+Uso:  python benchmark_cola.py
+"""
+
+import time
+
+from cola_doble import ColaFia, ColaDeque
+
+TAMANOS = [10**3, 10**4, 10**5, 10**6]
+OPERACIONES = 5000
+
+
+def medir(clase, n):
+  cola = clase()
+  for i in range(n):
+    cola.enqueue(i)
+
+  inicio = time.perf_counter()
+  for i in range(OPERACIONES):
+    cola.enqueue(cola.dequeue())
+  t_fin = time.perf_counter() - inicio
+
+  inicio = time.perf_counter()
+  for i in range(OPERACIONES):
+    cola.enqueue_front(i)
+    cola.dequeue()
+  t_frente = time.perf_counter() - inicio
+
+  # ops/s contando cada par como dos operaciones
+  return 2 * OPERACIONES / t_fin, 2 * OPERACIONES / t_frente
+
+
+if __name__ == "__main__":
+  print(f"{'n':>9} | {'motor':<9} | {'dequeue+enqueue ops/s':>22} | {'enqueue_front+dequeue ops/s':>28}")
+  print("-" * 78)
+  for n in TAMANOS:
+    for nombre, clase in (("lista", ColaFia), ("deque", ColaDeque)):
+      fin, frente = medir(clase, n)
+      print(f"{n:>9} | {nombre:<9} | {fin:>22,.0f} | {frente:>28,.0f}")
@@ -0,0 +1,114 @@
+"""
+Benchmark multi-hilo: ColaCircularConcurrente vs queue.Queue.
+
+PRODUCTORES hilos encolan ELEMENTOS marcas de tiempo en total y CONSUMIDORES
+hilos las drenan. Se reporta el throughput (elementos/s) y la latencia de
+cada elemento entre put y get (p50/p99). ColaCircularConcurrente se mide
+con get elemento a elemento y con get_many (un lock por lote).
+
+Uso:  python benchmark_concurrente.py
+"""
+
+import queue
+import threading
+import time
+
+from cola_circularIA import ColaCircularConcurrente
+
+ELEMENTOS = 200_000
+CAPACIDAD = 1024
+LOTE = 64
+CONFIGURACIONES = [(1, 1), (4, 4), (8, 2)]  # (productores, consumidores)
+
+FIN = None  # centinela para que cada consumidor termine
+
+
+def percentil(valores, p):
+  return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def ejecutar(put, consumir, productores, consumidores):
+  por_productor = ELEMENTOS // productores
+  latencias = [[] for _ in range(consumidores)]
+
+  def producir():
+    reloj = time.perf_counter
+    for _ in range(por_productor):
+      put(reloj())
+
+  hilos_p = [threading.Thread(target=producir) for _ in range(productores)]
+  hilos_c = [threading.Thread(target=consumir, args=(latencias[i],))
+             for i in range(consumidores)]
+
+  inicio = time.perf_counter()
+  for hilo in hilos_c + hilos_p:
+    hilo.start()
+  for hilo in hilos_p:
+    hilo.join()
+  for _ in range(consumidores):
+    put(FIN)
+  for hilo in hilos_c:
+    hilo.join()
+  total = time.perf_counter() - inicio
+
+  todas = sorted(l for lista in latencias for l in lista)
+  return len(todas) / total, percentil(todas, 0.50), percentil(todas, 0.99)
+
+
+def con_queue(productores, consumidores):
+  cola = queue.Queue(CAPACIDAD)
+
+  def consumir(latencias):
+    reloj = time.perf_counter
+    while True:
+      marca = cola.get()
+      if marca is FIN:
+        return
+      latencias.append(reloj() - marca)
+
+  return ejecutar(cola.put, consumir, productores, consumidores)
+
+
+def con_circular(productores, consumidores):
+  cola = ColaCircularConcurrente(CAPACIDAD)
+
+  def consumir(latencias):
+    reloj = time.perf_counter
+    while True:
+      marca = cola.get()
+      if marca is FIN:
+        return
+      latencias.append(reloj() - marca)
+
+  return ejecutar(cola.put, consumir, productores, consumidores)
+
+
+def con_circular_lotes(productores, consumidores):
+  cola = ColaCircularConcurrente(CAPACIDAD)
+
+  def consumir(latencias):
+    reloj = time.perf_counter
+    while True:
+      lote = cola.get_many(LOTE)
+      ahora = reloj()
+      for i, marca in enumerate(lote):
+        if marca is FIN:
+          # Devuelve los centinelas de los demás consumidores
+          for resto in lote[i + 1:]:
+            cola.put(resto)
+          return
+        latencias.append(ahora - marca)
+
+  return ejecutar(cola.put, consumir, productores, consumidores)
+
+
+if __name__ == "__main__":
+  print(f"{'P/C':>5} | {'cola':<28} | {'elem/s':>10} | {'p50 (us)':>9} | {'p99 (us)':>9}")
+  print("-" * 73)
+  for productores, consumidores in CONFIGURACIONES:
+    for nombre, medir in (("queue.Queue", con_queue),
+                          ("ColaCircularConcurrente", con_circular),
+                          (f"ColaCircularConcurrente x{LOTE}", con_circular_lotes)):
+      throughput, p50, p99 = medir(productores, consumidores)
+      print(f"{productores}/{consumidores:<3} | {nombre:<28} | {throughput:>10,.0f} | "
+            f"{p50 * 1e6:>9.1f} | {p99 * 1e6:>9.1f}")
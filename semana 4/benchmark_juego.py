@@ -0,0 +1,91 @@
+"""
+Benchmark sin ventana del bucle de Juego.py.
+
+Usa el driver de video "dummy" de SDL y superficies generadas en lugar de
+fondo.png/pelota.png/FIA.png, así corre en CI o en un servidor. Ejecuta
+FRAMES frames sin el límite de 60 fps en cada modo de dibujo y reporta
+frames/s y los percentiles p50/p95/p99 del tiempo por frame, separados en
+entrada, física y dibujo.
+
+Uso:  python benchmark_juego.py [frames] [--json]
+      (--json imprime una línea JSON por modo, para comparar entre corridas)
+"""
+
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # sin el saludo en stdout (rompería --json)
+
+import pygame
+
+from Juego import ALTO, ANCHO, JuegoRebote
+
+FRAMES = 5000
+FASES = ("entrada", "fisica", "dibujo", "total")
+
+
+def superficies_de_prueba():
+    """Fondo, pelota y bate generados, con tamaños y transparencia parecidos a las imágenes reales."""
+    fondo = pygame.Surface((ANCHO, ALTO), pygame.SRCALPHA)
+    for y in range(0, ALTO, 16):
+        pygame.draw.rect(fondo, (120, 180, 220, 160), (0, y, ANCHO, 8))
+    ball = pygame.Surface((40, 40), pygame.SRCALPHA)
+    pygame.draw.circle(ball, (220, 60, 40), (20, 20), 20)
+    bate = pygame.Surface((160, 20), pygame.SRCALPHA)
+    bate.fill((60, 60, 60))
+    return fondo.convert_alpha(), ball.convert_alpha(), bate.convert_alpha()
+
+
+def percentil(valores, p):
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def medir(ventana, modo, frames):
+    juego = JuegoRebote(ventana, *superficies_de_prueba(), modo=modo)
+    marcas = []  # 4 instantes por frame, los agrega JuegoRebote.frame
+    inicio = time.perf_counter()
+    for _ in range(frames):
+        juego.frame(marcas)
+    segundos = time.perf_counter() - inicio
+
+    tiempos = {fase: [] for fase in FASES}
+    for i in range(0, len(marcas), 4):
+        t0, t1, t2, t3 = marcas[i:i + 4]
+        tiempos["entrada"].append(t1 - t0)
+        tiempos["fisica"].append(t2 - t1)
+        tiempos["dibujo"].append(t3 - t2)
+        tiempos["total"].append(t3 - t0)
+
+    resultado = {"modo": modo, "frames": frames, "fps": frames / segundos}
+    for fase in FASES:
+        valores = sorted(tiempos[fase])
+        for p in (50, 95, 99):
+            resultado[f"{fase}_p{p}_us"] = percentil(valores, p / 100) * 1e6
+    return resultado
+
+
+if __name__ == "__main__":
+    argumentos = [a for a in sys.argv[1:] if a != "--json"]
+    frames = int(argumentos[0]) if argumentos else FRAMES
+    como_json = "--json" in sys.argv[1:]
+
+    pygame.init()
+    ventana = pygame.display.set_mode((ANCHO, ALTO))
+    resultados = [medir(ventana, modo, frames) for modo in ("completo", "sucio")]
+    pygame.quit()
+
+    if como_json:
+        for resultado in resultados:
+            print(json.dumps(resultado))
+        sys.exit()
+
+    for r in resultados:
+        print(f"\nModo {r['modo']}: {r['frames']} frames, {r['fps']:.0f} frames/s")
+        print(f"{'fase':>8} | {'p50 (us)':>9} | {'p95 (us)':>9} | {'p99 (us)':>9}")
+        print("-" * 45)
+        for fase in FASES:
+            print(f"{fase:>8} | {r[f'{fase}_p50_us']:>9.1f} | {r[f'{fase}_p95_us']:>9.1f} | {r[f'{fase}_p99_us']:>9.1f}")
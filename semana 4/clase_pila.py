@@ -1,3 +1,5 @@
+from numbers import Real
+
 class PilaFia:
   def __init__(self):
     self.stack = []
@@ -20,7 +22,70 @@ class PilaFia:
 
   def size(self):
     return len(self.stack)
-  
+
+# Pila que además mantiene mínimo, máximo y suma de los elementos actuales.
+# Cada nivel guarda el agregado de todo lo que hay debajo (incluido él), así
+# pop solo descarta el último nivel y las consultas son O(1). 'operacion' es
+# opcional: una función asociativa f(a, b) cuyo resultado se consulta con
+# agregado() (por ejemplo math.gcd o lambda a, b: a * b).
+# push acepta cualquier valor, como PilaFia: la suma solo se lleva mientras
+# todos los elementos sean números, y mínimo/máximo mientras se puedan
+# comparar; si no, esas consultas devuelven None.
+_SIN_ORDEN = object()  # marca de mínimo/máximo indefinido (None puede ser un elemento)
+
+class PilaAgregada(PilaFia):
+  def __init__(self, operacion=None):
+    super().__init__()
+    self.operacion = operacion
+    self.agregados = []  # (minimo, maximo, suma, agregado) por nivel
+
+  def push(self, element):
+    numero = isinstance(element, Real)
+    if self.agregados:
+      minimo, maximo, suma, agregado = self.agregados[-1]
+      if minimo is not _SIN_ORDEN:
+        try:
+          minimo, maximo = min(minimo, element), max(maximo, element)
+        except TypeError:  # tipos que no se comparan (None, str con int, ...)
+          minimo = maximo = _SIN_ORDEN
+      suma = suma + element if numero and suma is not None else None
+      if self.operacion is not None:
+        agregado = self.operacion(agregado, element)
+      self.agregados.append((minimo, maximo, suma, agregado))
+    else:
+      self.agregados.append((element, element, element if numero else None, element))
+    self.stack.append(element)
+
+  def pop(self):
+    if self.isEmpty():
+      return "Pila está vacía"
+    self.agregados.pop()
+    return self.stack.pop()
+
+  def minimo(self):
+    if self.isEmpty():
+      return "Pila está vacía"
+    minimo = self.agregados[-1][0]
+    return None if minimo is _SIN_ORDEN else minimo
+
+  def maximo(self):
+    if self.isEmpty():
+      return "Pila está vacía"
+    maximo = self.agregados[-1][1]
+    return None if maximo is _SIN_ORDEN else maximo
+
+  def suma(self):
+    if self.isEmpty():
+      return "Pila está vacía"
+    return self.agregados[-1][2]
+
+  def agregado(self):
+    if self.isEmpty():
+      return "Pila está vacía"
+    if self.operacion is None:
+      return None
+    return self.agregados[-1][3]
+
   # Creaando una pila de libros 
 miPilaLibros = PilaFia()
 
@@ -33,4 +98,14 @@ print("Saco el libro que ingresó al último: ", miPilaLibros.pop())
 print("Pila despues de sacar el ultimo libro: ", miPilaLibros.stack)
 print("Nuevo elemento superior : ", miPilaLibros.peek())
 print("Está vacía la pila?: ", miPilaLibros.isEmpty())
-print("Tamaño: ", miPilaLibros.size())
\ No newline at end of file
+print("Tamaño: ", miPilaLibros.size())
+
+# Pila de notas con mínimo, máximo y suma en O(1)
+miPilaNotas = PilaAgregada(operacion=lambda a, b: a * b)
+for nota in [14, 9, 18, 11]:
+  miPilaNotas.push(nota)
+print("\nPila de notas: ", miPilaNotas.stack)
+print("Mínimo: ", miPilaNotas.minimo(), " Máximo: ", miPilaNotas.maximo(), " Suma: ", miPilaNotas.suma())
+print("Producto: ", miPilaNotas.agregado())
+print("Saco: ", miPilaNotas.pop(), "->", miPilaNotas.pop())
+print("Mínimo: ", miPilaNotas.minimo(), " Máximo: ", miPilaNotas.maximo(), " Suma: ", miPilaNotas.suma())
@@ -1,3 +1,5 @@
+from collections import deque
+
 class ColaFia:
   def __init__(self):
     self.queue = []
@@ -22,6 +24,21 @@ class ColaFia:
   def size(self):
     return len(self.queue)
 
+# Variante con motor collections.deque: misma interfaz que ColaFia,
+# pero enqueue, dequeue, peek y enqueue_front trabajan en O(1) en ambos
+# extremos (list.pop(0) e insert(0, ...) desplazan toda la lista).
+class ColaDeque(ColaFia):
+  def __init__(self):
+    self.queue = deque()
+
+  def enqueue_front(self, element):
+    self.queue.appendleft(element)
+
+  def dequeue(self):
+    if self.isEmpty():
+      return "La cola está vacía"
+    return self.queue.popleft()
+
 # Create a queue
 myColaMatrucula = ColaFia()
 
@@ -36,6 +53,13 @@ print("Cola después de eliminar: ", myColaMatrucula.queue)
 print("Está vacía: ", myColaMatrucula.isEmpty())
 print("Tamaño: ", myColaMatrucula.size())
 
+# La misma cola con motor deque
+myColaDeque = ColaDeque()
+myColaDeque.enqueue('Aldo')
+myColaDeque.enqueue('Bianca')
+myColaDeque.enqueue('Carlos')
 
-
-      
\ No newline at end of file
+print("\nCola (deque): ", list(myColaDeque.queue))
+print("Elimina: ", myColaDeque.dequeue())
+print("Cola después de eliminar: ", list(myColaDeque.queue))
+print("Tamaño: ", myColaDeque.size())
@@ -0,0 +1,127 @@
+import asyncio
+from collections import deque
+
+# Cola para asyncio con la semántica de ColaFia/ColaCircular:
+# enqueue, enqueue_front, dequeue y peek sobre una deque (O(1) en ambos
+# extremos). Con capacidad > 0 es acotada: 'await enqueue(...)' espera a que
+# se libere lugar (backpressure) y 'await dequeue()' espera a que haya
+# elementos. Las variantes *_nowait no suspenden y devuelven los mismos
+# mensajes que la ColaFia original. 'async for' drena la cola hasta cerrar().
+class ColaAsincrona:
+  def __init__(self, capacidad=0):
+    self.queue = deque()
+    self.capacidad = capacidad  # 0 = sin límite
+    self.cerrada = False
+    self._productores = deque()  # futures de enqueue esperando lugar
+    self._consumidores = deque()  # futures de dequeue esperando elementos
+
+  def _despertar(self, esperando):
+    while esperando:
+      futuro = esperando.popleft()
+      if not futuro.done():
+        futuro.set_result(None)
+        return
+
+  async def _esperar(self, esperando):
+    futuro = asyncio.get_running_loop().create_future()
+    esperando.append(futuro)
+    try:
+      await futuro
+    except BaseException:
+      if futuro.done() and not futuro.cancelled():
+        # Nos despertaron pero nos cancelaron: se pasa el turno al siguiente
+        self._despertar(esperando)
+      else:
+        futuro.cancel()
+        try:
+          esperando.remove(futuro)
+        except ValueError:
+          pass
+      raise
+
+  def enqueue_nowait(self, element):
+    if self.isFull():
+      return "La cola está llena"
+    self.queue.append(element)
+    self._despertar(self._consumidores)
+
+  def enqueue_front_nowait(self, element):
+    if self.isFull():
+      return "La cola está llena"
+    self.queue.appendleft(element)
+    self._despertar(self._consumidores)
+
+  def dequeue_nowait(self):
+    if self.isEmpty():
+      return "La cola está vacía"
+    elemento = self.queue.popleft()
+    self._despertar(self._productores)
+    return elemento
+
+  async def enqueue(self, element):
+    while self.isFull():
+      await self._esperar(self._productores)
+    self.enqueue_nowait(element)
+
+  async def enqueue_front(self, element):
+    while self.isFull():
+      await self._esperar(self._productores)
+    self.enqueue_front_nowait(element)
+
+  async def dequeue(self):
+    while self.isEmpty():
+      if self.cerrada:
+        return "La cola está vacía"
+      await self._esperar(self._consumidores)
+    return self.dequeue_nowait()
+
+  def cerrar(self):
+    # Los consumidores que esperan terminan cuando la cola queda vacía
+    self.cerrada = True
+    while self._consumidores:
+      self._despertar(self._consumidores)
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    while self.isEmpty():
+      if self.cerrada:
+        raise StopAsyncIteration
+      await self._esperar(self._consumidores)
+    return self.dequeue_nowait()
+
+  def peek(self):
+    if self.isEmpty():
+      return "La cola está vacía"
+    return self.queue[0]
+
+  def isEmpty(self):
+    return len(self.queue) == 0
+
+  def isFull(self):
+    return self.capacidad > 0 and len(self.queue) >= self.capacidad
+
+  def size(self):
+    return len(self.queue)
+
+
+async def main():
+  miCola = ColaAsincrona(capacidad=2)
+
+  async def productor():
+    for nombre in ['Aldo', 'Bianca', 'Carlos', 'Diana']:
+      await miCola.enqueue(nombre)  # espera cuando la cola está llena
+    await miCola.enqueue_front('Elena')
+    miCola.cerrar()
+
+  tarea = asyncio.create_task(productor())
+  atendidos = [nombre async for nombre in miCola]
+  await tarea
+  print("Atendidos: ", atendidos)
+  print("Está vacía: ", miCola.isEmpty())
+  print("Dequeue en cola cerrada: ", await miCola.dequeue())
+
+
+if __name__ == "__main__":
+  asyncio.run(main())
@@ -1,3 +1,5 @@
+import threading
+
 # Clase original ColaFia
 class ColaFia:
   def __init__(self):
@@ -26,40 +28,103 @@ class ColaFia:
     return len(self.queue)
 
 # Clase extendida ColaCircular
+# Con crecer=True el anillo duplica su capacidad en vez de responder
+# "La cola está llena"; con encoger=True se reduce a la mitad cuando queda
+# ocupado a menos de un cuarto (sin bajar de la capacidad inicial ni de 1).
 class ColaCircular(ColaFia):
-  def __init__(self, capacidad):
+  def __init__(self, capacidad, crecer=False, encoger=False):
     super().__init__()
     self.capacidad = capacidad
+    self.capacidad_inicial = capacidad
+    self.crecer = crecer
+    self.encoger = encoger
     self.inicio = 0
     self.fin = 0
     self.count = 0
     self.queue = [None] * capacidad  # Sobrescribe con tamaño fijo
 
+  def _redimensionar(self, nueva_capacidad):
+    # Copia los elementos en orden al inicio de un arreglo nuevo
+    elementos = self._elementos()
+    self.queue = elementos + [None] * (nueva_capacidad - self.count)
+    self.capacidad = nueva_capacidad
+    self.inicio = 0
+    self.fin = self.count % nueva_capacidad
+
+  def _hay_espacio(self, cantidad):
+    if self.count + cantidad <= self.capacidad:
+      return True
+    if not self.crecer:
+      return False
+    nueva = max(self.capacidad, 1)
+    while nueva < self.count + cantidad:
+      nueva *= 2
+    self._redimensionar(nueva)
+    return True
+
+  def _tal_vez_encoger(self):
+    # Nunca a 0: con capacidad 0 los índices (% capacidad) dividen por cero
+    minima = max(self.capacidad_inicial, 1)
+    if (self.encoger and self.capacidad // 2 >= minima
+        and self.count <= self.capacidad // 4):
+      self._redimensionar(self.capacidad // 2)
+
   def enqueue(self, element):
-    if self.count == self.capacidad:
+    if not self._hay_espacio(1):
       return "La cola está llena"
     self.queue[self.fin] = element
     self.fin = (self.fin + 1) % self.capacidad
     self.count += 1
 
   def enqueue_front(self, element):
-    if self.count == self.capacidad:
+    if not self._hay_espacio(1):
       return "La cola está llena"
     self.inicio = (self.inicio - 1 + self.capacidad) % self.capacidad
     self.queue[self.inicio] = element
     self.count += 1
 
+  def enqueue_many(self, elementos):
+    # Copia el lote en a lo sumo dos tramos contiguos (hasta el final del
+    # arreglo y luego desde el índice 0). Todo o nada si no hay espacio.
+    elementos = list(elementos)
+    cantidad = len(elementos)
+    if cantidad == 0:
+      return
+    if not self._hay_espacio(cantidad):
+      return "La cola está llena"
+    tramo = min(cantidad, self.capacidad - self.fin)
+    self.queue[self.fin:self.fin + tramo] = elementos[:tramo]
+    self.queue[:cantidad - tramo] = elementos[tramo:]
+    self.fin = (self.fin + cantidad) % self.capacidad
+    self.count += cantidad
+
   def dequeue(self):
-    if self.isEmpty():
+    if self.count == 0:
       return "La cola está vacía"
     elemento = self.queue[self.inicio]
     self.queue[self.inicio] = None
     self.inicio = (self.inicio + 1) % self.capacidad
     self.count -= 1
+    self._tal_vez_encoger()
     return elemento
 
+  def dequeue_many(self, cantidad):
+    # Saca hasta 'cantidad' elementos (los que haya) en a lo sumo dos tramos
+    cantidad = min(cantidad, self.count)
+    if cantidad <= 0:
+      return []
+    tramo = min(cantidad, self.capacidad - self.inicio)
+    resto = cantidad - tramo
+    resultado = self.queue[self.inicio:self.inicio + tramo] + self.queue[:resto]
+    self.queue[self.inicio:self.inicio + tramo] = [None] * tramo
+    self.queue[:resto] = [None] * resto
+    self.inicio = (self.inicio + cantidad) % self.capacidad
+    self.count -= cantidad
+    self._tal_vez_encoger()
+    return resultado
+
   def peek(self):
-    if self.isEmpty():
+    if self.count == 0:
       return "La cola está vacía"
     return self.queue[self.inicio]
 
@@ -70,50 +135,180 @@ class ColaCircular(ColaFia):
     return self.count
 
   def mostrarCola(self):
-    resultado = []
-    i = self.inicio
-    for _ in range(self.count):
-      resultado.append(self.queue[i])
-      i = (i + 1) % self.capacidad
-    return resultado
+    return self._elementos()
+
+  # Los métodos internos usan count y _elementos (no isEmpty/mostrarCola)
+  # para que la variante concurrente pueda tomar el lock en los públicos
+  def _elementos(self):
+    # Dos rebanadas: desde inicio hasta el final del arreglo y el resto
+    # que dio la vuelta al índice 0
+    limite = self.inicio + self.count
+    if limite <= self.capacidad:
+      return self.queue[self.inicio:limite]
+    return self.queue[self.inicio:] + self.queue[:limite - self.capacidad]
+
+# Variante concurrente de ColaCircular para productores/consumidores en
+# varios hilos. Todas las operaciones toman el mismo lock; put/get bloquean
+# hasta que haya lugar/elementos (o vence el timeout, en cuyo caso devuelven
+# el mismo mensaje que enqueue/dequeue). Los métodos heredados que no
+# bloquean (enqueue_many, dequeue_many, ...) también toman el lock y
+# despiertan a quienes esperan en put/get.
+class ColaCircularConcurrente(ColaCircular):
+  def __init__(self, capacidad, crecer=False, encoger=False):
+    super().__init__(capacidad, crecer, encoger)
+    self._lock = threading.Lock()
+    self._no_vacia = threading.Condition(self._lock)
+    self._no_llena = threading.Condition(self._lock)
+
+  def _hay_lugar(self):
+    return self.crecer or self.count < self.capacidad
+
+  def _hay_elementos(self):
+    return self.count > 0
+
+  def put(self, element, timeout=None):
+    with self._no_llena:
+      if not self._no_llena.wait_for(self._hay_lugar, timeout):
+        return "La cola está llena"
+      ColaCircular.enqueue(self, element)
+      self._no_vacia.notify()
+
+  def get(self, timeout=None):
+    with self._no_vacia:
+      if not self._no_vacia.wait_for(self._hay_elementos, timeout):
+        return "La cola está vacía"
+      elemento = ColaCircular.dequeue(self)
+      self._no_llena.notify()
+      return elemento
+
+  def try_put(self, element):
+    return self.put(element, timeout=0)
+
+  def try_get(self):
+    return self.get(timeout=0)
+
+  def get_many(self, cantidad, timeout=None):
+    # Espera a que haya al menos un elemento y devuelve hasta 'cantidad'
+    # con una sola adquisición del lock
+    with self._no_vacia:
+      if not self._no_vacia.wait_for(self._hay_elementos, timeout):
+        return []
+      resultado = ColaCircular.dequeue_many(self, cantidad)
+      self._no_llena.notify(len(resultado))
+      return resultado
+
+  def enqueue(self, element):
+    return self.try_put(element)
+
+  def enqueue_front(self, element):
+    with self._lock:
+      if not self._hay_lugar():
+        return "La cola está llena"
+      ColaCircular.enqueue_front(self, element)
+      self._no_vacia.notify()
+
+  def enqueue_many(self, elementos):
+    elementos = list(elementos)
+    with self._lock:
+      resultado = ColaCircular.enqueue_many(self, elementos)
+      if resultado is None:
+        self._no_vacia.notify(len(elementos))
+      return resultado
+
+  def dequeue(self):
+    return self.try_get()
+
+  def dequeue_many(self, cantidad):
+    with self._lock:
+      resultado = ColaCircular.dequeue_many(self, cantidad)
+      self._no_llena.notify(len(resultado))
+      return resultado
+
+  def peek(self):
+    with self._lock:
+      return ColaCircular.peek(self)
+
+  def isEmpty(self):
+    with self._lock:
+      return self.count == 0
+
+  def size(self):
+    with self._lock:
+      return self.count
+
+  def mostrarCola(self):
+    with self._lock:
+      return self._elementos()
+
+if __name__ == "__main__":
+  # Ejemplo de uso con ColaFia
+  print("=== ColaFia ===")
+  myColaMatrucula = ColaFia()
+  myColaMatrucula.enqueue('Aldo')
+  myColaMatrucula.enqueue('Bianca')
+  myColaMatrucula.enqueue('Carlos')
+
+  print("Cola: ", myColaMatrucula.queue)
+  print("Primer elemento: ", myColaMatrucula.peek())
+  print("Elimina: ", myColaMatrucula.dequeue())
+  print("Cola después de eliminar: ", myColaMatrucula.queue)
+  print("Está vacía: ", myColaMatrucula.isEmpty())
+  print("Tamaño: ", myColaMatrucula.size())
+
+  myColaMatrucula.enqueue('Diana')
+  print("Cola después de agregar un nuevo elemento: ", myColaMatrucula.queue)
+  print("Nuevo primer elemento: ", myColaMatrucula.peek())
+  print("Tamaño: ", myColaMatrucula.size())
+
+  myColaMatrucula.enqueue_front('Elena')
+  print("Cola después de agregar un nuevo elemento al inicio: ", myColaMatrucula.queue)
+  print("Nuevo primer elemento: ", myColaMatrucula.peek())
+
+  # Ejemplo de uso con ColaCircular
+  print("\n=== ColaCircular ===")
+  miColaCircular = ColaCircular(5)
+  print("Agregando elementos...")
+  print(miColaCircular.enqueue('Aldo'))
+  print(miColaCircular.enqueue('Bianca'))
+  print(miColaCircular.enqueue('Carlos'))
+  print("Cola circular: ", miColaCircular.mostrarCola())
+
+  print("Elimina: ", miColaCircular.dequeue())
+  print("Cola después de eliminar: ", miColaCircular.mostrarCola())
+
+  print("Agrega Diana: ", miColaCircular.enqueue('Diana'))
+  print("Agrega Elena al frente: ", miColaCircular.enqueue_front('Elena'))
+  print("Cola final: ", miColaCircular.mostrarCola())
+  print("Primer elemento: ", miColaCircular.peek())
+  print("Tamaño: ", miColaCircular.size())
+
+  # Ejemplo de uso con ColaCircular que crece y operaciones por lotes
+  print("\n=== ColaCircular (crecer=True, encoger=True) ===")
+  miColaDinamica = ColaCircular(4, crecer=True, encoger=True)
+  miColaDinamica.enqueue_many(['Aldo', 'Bianca', 'Carlos', 'Diana', 'Elena', 'Fabio'])
+  print("Cola: ", miColaDinamica.mostrarCola())
+  print("Capacidad: ", miColaDinamica.capacidad)
+  print("Saca 5: ", miColaDinamica.dequeue_many(5))
+  print("Cola: ", miColaDinamica.mostrarCola())
+  print("Capacidad tras encoger: ", miColaDinamica.capacidad)
+
+  # Ejemplo de uso con ColaCircularConcurrente: dos productores y un consumidor
+  print("\n=== ColaCircularConcurrente ===")
+  miColaConcurrente = ColaCircularConcurrente(2)
+
+  def productor(nombres):
+    for nombre in nombres:
+      miColaConcurrente.put(nombre)
+
+  hilos = [threading.Thread(target=productor, args=(['Aldo', 'Bianca'],)),
+           threading.Thread(target=productor, args=(['Carlos', 'Diana'],))]
+  for hilo in hilos:
+    hilo.start()
+  atendidos = []
+  while len(atendidos) < 4:
+    atendidos.extend(miColaConcurrente.get_many(4))
+  for hilo in hilos:
+    hilo.join()
+  print("Atendidos: ", sorted(atendidos))
+  print("Get con timeout en cola vacía: ", miColaConcurrente.get(timeout=0.01))
 
-# Ejemplo de uso con ColaFia
-print("=== ColaFia ===")
-myColaMatrucula = ColaFia()
-myColaMatrucula.enqueue('Aldo')
-myColaMatrucula.enqueue('Bianca')
-myColaMatrucula.enqueue('Carlos')
-
-print("Cola: ", myColaMatrucula.queue)
-print("Primer elemento: ", myColaMatrucula.peek())
-print("Elimina: ", myColaMatrucula.dequeue())
-print("Cola después de eliminar: ", myColaMatrucula.queue)
-print("Está vacía: ", myColaMatrucula.isEmpty())
-print("Tamaño: ", myColaMatrucula.size())
-
-myColaMatrucula.enqueue('Diana')
-print("Cola después de agregar un nuevo elemento: ", myColaMatrucula.queue)
-print("Nuevo primer elemento: ", myColaMatrucula.peek())
-print("Tamaño: ", myColaMatrucula.size())
-
-myColaMatrucula.enqueue_front('Elena')
-print("Cola después de agregar un nuevo elemento al inicio: ", myColaMatrucula.queue)
-print("Nuevo primer elemento: ", myColaMatrucula.peek())
-
-# Ejemplo de uso con ColaCircular
-print("\n=== ColaCircular ===")
-miColaCircular = ColaCircular(5)
-print("Agregando elementos...")
-print(miColaCircular.enqueue('Aldo'))
-print(miColaCircular.enqueue('Bianca'))
-print(miColaCircular.enqueue('Carlos'))
-print("Cola circular: ", miColaCircular.mostrarCola())
-
-print("Elimina: ", miColaCircular.dequeue())
-print("Cola después de eliminar: ", miColaCircular.mostrarCola())
-
-print("Agrega Diana: ", miColaCircular.enqueue('Diana'))
-print("Agrega Elena al frente: ", miColaCircular.enqueue_front('Elena'))
-print("Cola final: ", miColaCircular.mostrarCola())
-print("Primer elemento: ", miColaCircular.peek())
-print("Tamaño: ", miColaCircular.size())
@@ -1,3 +1,5 @@
+from collections import deque
+
 class ColaFia:
   def __init__(self):
     self.queue = []
@@ -25,25 +27,50 @@ class ColaFia:
   def size(self):
     return len(self.queue)
 
-# Create a queue
-myColaMatrucula = ColaFia()
+# Variante con motor collections.deque: misma interfaz que ColaFia,
+# pero enqueue, dequeue, peek y enqueue_front trabajan en O(1) en ambos
+# extremos (list.pop(0) e insert(0, ...) desplazan toda la lista).
+class ColaDeque(ColaFia):
+  def __init__(self):
+    self.queue = deque()
+
+  def enqueue_front(self, element):
+    self.queue.appendleft(element)
+
+  def dequeue(self):
+    if self.isEmpty():
+      return "La cola está vacía"
+    return self.queue.popleft()
+
+if __name__ == "__main__":
+  # Create a queue
+  myColaMatrucula = ColaFia()
+
+  myColaMatrucula.enqueue('Aldo')
+  myColaMatrucula.enqueue('Bianca')
+  myColaMatrucula.enqueue('Carlos')
 
-myColaMatrucula.enqueue('Aldo')
-myColaMatrucula.enqueue('Bianca')
-myColaMatrucula.enqueue('Carlos')
+  print("Cola: ", myColaMatrucula.queue)
+  print("Primer elemento: ", myColaMatrucula.peek())
+  print("Elimina: ", myColaMatrucula.dequeue())
+  print("Cola después de eliminar: ", myColaMatrucula.queue)
+  print("Está vacía: ", myColaMatrucula.isEmpty())
+  print("Tamaño: ", myColaMatrucula.size())
 
-print("Cola: ", myColaMatrucula.queue)
-print("Primer elemento: ", myColaMatrucula.peek())
-print("Elimina: ", myColaMatrucula.dequeue())
-print("Cola después de eliminar: ", myColaMatrucula.queue)
-print("Está vacía: ", myColaMatrucula.isEmpty())
-print("Tamaño: ", myColaMatrucula.size())
+  myColaMatrucula.enqueue('Diana')
+  print("Cola después de agregar un nuevo elemento: ", myColaMatrucula.queue)
+  print("Nuevo primer elemento: ", myColaMatrucula.peek())
+  print("Tamaño: ", myColaMatrucula.size())
 
-myColaMatrucula.enqueue('Diana')
-print("Cola después de agregar un nuevo elemento: ", myColaMatrucula.queue)
-print("Nuevo primer elemento: ", myColaMatrucula.peek())
-print("Tamaño: ", myColaMatrucula.size())
+  myColaMatrucula.enqueue_front('Elena')
+  print("Cola después de agregar un nuevo elemento al inicio: ", myColaMatrucula.queue)
+  print("Nuevo primer elemento: ", myColaMatrucula.peek())
 
-myColaMatrucula.enqueue_front('Elena')
-print("Cola después de agregar un nuevo elemento al inicio: ", myColaMatrucula.queue)
-print("Nuevo primer elemento: ", myColaMatrucula.peek())   
\ No newline at end of file
+  # La misma cola con motor deque
+  myColaDeque = ColaDeque()
+  myColaDeque.enqueue('Aldo')
+  myColaDeque.enqueue('Bianca')
+  myColaDeque.enqueue_front('Elena')
+  print("\nCola (deque): ", list(myColaDeque.queue))
+  print("Elimina: ", myColaDeque.dequeue())
+  print("Primer elemento: ", myColaDeque.peek())